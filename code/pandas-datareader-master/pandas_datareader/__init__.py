@@ -1,4 +1,4 @@
 __version__ = version = '0.5.0'
 
 from .data import (get_components_yahoo, get_data_famafrench, get_data_google, get_data_yahoo, get_data_enigma,  # noqa
-        get_data_yahoo_actions, get_quote_google, get_quote_yahoo, DataReader, Options)  # noqa
+        get_data_yahoo_actions, get_quote_google, get_quote_yahoo, DataReader, Options, DataSource, register_source)  # noqa
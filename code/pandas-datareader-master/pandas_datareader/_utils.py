@@ -1,10 +1,9 @@
 import datetime as dt
+from multiprocessing.pool import ThreadPool
 
 import requests
 from pandas import to_datetime
 from pandas_datareader.compat import is_number
-from requests_file import FileAdapter
-from requests_ftp import FTPAdapter
 
 
 class SymbolWarning(UserWarning):
@@ -37,10 +36,41 @@ def _sanitize_dates(start, end):
     return start, end
 
 
+def _compact_frame(df, dtypes):
+    """
+    Cast the columns of ``df`` named in ``dtypes`` to their compact dtype
+    """
+    for col, dtype in dtypes.items():
+        if col in df.columns and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
 def _init_session(session, retry_count=3):
     if session is None:
+        # the adapters are only needed once a session is created
+        from requests_file import FileAdapter
+        from requests_ftp import FTPAdapter
         session = requests.Session()
         session.mount('file://', FileAdapter())
         session.mount('ftp://', FTPAdapter())
         # do not set requests max_retries here to support arbitrary pause
     return session
+
+
+def _map_concurrent(func, items, max_workers=1):
+    """
+    Return ``[func(item) for item in items]``, evaluated on a pool of at most
+    ``max_workers`` threads. Results keep the order of ``items``; an
+    exception raised by ``func`` is re-raised in the caller.
+    """
+    items = list(items)
+    workers = min(max_workers or 1, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    pool = ThreadPool(workers)
+    try:
+        return pool.map(func, items, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
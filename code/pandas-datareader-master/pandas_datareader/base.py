@@ -6,12 +6,14 @@ import requests
 
 import pandas.compat as compat
 from pandas import Panel, DataFrame
-from pandas import read_csv
+from pandas import read_csv, to_datetime
 from pandas.io.common import urlencode
 from pandas.compat import StringIO, bytes_to_str
 
 from pandas_datareader._utils import (RemoteDataError, SymbolWarning,
-                                      _sanitize_dates, _init_session)
+                                      _sanitize_dates, _init_session,
+                                      _compact_frame)
+from pandas_datareader.hooks import _active, _clock, _emit
 
 
 class _BaseReader(object):
@@ -32,13 +34,32 @@ class _BaseReader(object):
                 Time, in seconds, of the pause between retries.
         session : Session, default None
                 requests.sessions.Session instance to be used
+        compact : bool, default False
+                Return repeated strings as categoricals and prices as
+                float32 where the reader defines a compact schema.
+
+    Attributes
+    ----------
+        hooks : list
+                callables receiving a ``pandas_datareader.hooks.Span`` for
+                every phase of this reader's requests, in addition to the
+                hooks registered with ``pandas_datareader.hooks.add_hook``
     """
 
     _chunk_size = 1024 * 1024
     _format = 'string'
+    # column -> dtype used when compact=True
+    _compact_dtypes = {}
+    # fixed layout of CSV responses, {'date_format': ..., 'dtype': {...}};
+    # None to infer dates and dtypes
+    _schema = None
+    # whether responses may be served from a cache, e.g. a requests_cache
+    # session; set from DataSource.cacheable
+    _cacheable = True
 
     def __init__(self, symbols, start=None, end=None,
-                 retry_count=3, pause=0.1, timeout=30, session=None):
+                 retry_count=3, pause=0.1, timeout=30, session=None,
+                 compact=False):
         self.symbols = symbols
 
         start, end = _sanitize_dates(start, end)
@@ -52,6 +73,8 @@ class _BaseReader(object):
         self.timeout = timeout
         self.pause_multiplier = 1
         self.session = _init_session(session, retry_count)
+        self.hooks = []
+        self.compact = compact
 
     def close(self):
         """ close my session """
@@ -78,16 +101,29 @@ class _BaseReader(object):
         if self._format == 'string':
             out = self._read_url_as_StringIO(url, params=params)
         elif self._format == 'json':
-            out = self._get_response(url, params=params).json()
+            response = self._get_response(url, params=params)
+            start = _clock()
+            out = response.json()
+            self._emit('decode', _clock() - start, url=url)
         else:
             raise NotImplementedError(self._format)
-        return self._read_lines(out)
+        start = _clock()
+        df = self._read_lines(out)
+        self._emit('parse', _clock() - start, url=url)
+        return df
 
     def _read_url_as_StringIO(self, url, params=None):
         """
         Open url (and retry)
         """
         response = self._get_response(url, params=params)
+        return self._response_as_StringIO(response)
+
+    def _response_as_StringIO(self, response):
+        """
+        Wrap the (sanitized) body of a response in a StringIO
+        """
+        start = _clock()
         text = self._sanitize_response(response)
         out = StringIO()
         if len(text) == 0:
@@ -99,6 +135,8 @@ class _BaseReader(object):
         else:
             out.write(text)
         out.seek(0)
+        self._emit('decode', _clock() - start, url=response.url,
+                   nbytes=len(text))
         return out
 
     @staticmethod
@@ -118,44 +156,123 @@ class _BaseReader(object):
             parameters passed to the URL
         """
 
+        # 304 only answers a conditional request; the caller has a copy
+        conditional = any(h in (headers or {}) for h in
+                          ('If-None-Match', 'If-Modified-Since'))
         # initial attempt + retry
         pause = self.pause
         for i in range(self.retry_count + 1):
-            response = self.session.get(url,
-                                        params=params,
-                                        headers=headers)
-            if response.status_code == requests.codes.ok:
+            response = self._send(url, attempt=i, params=params,
+                                  headers=headers)
+            if (response.status_code == requests.codes.ok or
+                    (conditional and
+                     response.status_code == requests.codes.not_modified)):
                 return response
 
+            start = _clock()
             time.sleep(pause)
 
             # Increase time between subsequent requests, per subclass.
             pause *= self.pause_multiplier
-            # Get a new breadcrumb if necessary, in case ours is invalidated
-            if isinstance(params, list) and 'crumb' in params:
-                params['crumb'] = self._get_crumb(self.retry_count)
+            # Get a new breadcrumb if ours was rejected (401/403); other
+            # errors, e.g. 404 for an unknown symbol, keep the crumb
+            if (isinstance(params, dict) and 'crumb' in params and
+                    response.status_code in (requests.codes.unauthorized,
+                                             requests.codes.forbidden)):
+                params['crumb'] = self._get_crumb(self.retry_count,
+                                                  params['crumb'])
+            self._emit('retry', _clock() - start, url=url, attempt=i,
+                       status=response.status_code)
         if params is not None and len(params) > 0:
             url = url + "?" + urlencode(params)
         raise RemoteDataError('Unable to read URL: {0}'.format(url))
 
+    def _send(self, url, attempt=0, method='get', **kwargs):
+        """
+        Send one request through the session, reporting its 'request' and
+        'transfer' spans to the hooks
+        """
+        start = _clock()
+        try:
+            if (not self._cacheable and
+                    hasattr(self.session, 'cache_disabled')):
+                # requests_cache session; always ask the upstream
+                with self.session.cache_disabled():
+                    response = getattr(self.session, method)(url, **kwargs)
+            else:
+                response = getattr(self.session, method)(url, **kwargs)
+        except Exception as e:
+            self._emit('request', _clock() - start, url=url, attempt=attempt,
+                       error=e)
+            raise
+        if _active(self.hooks):
+            total = _clock() - start
+            # time until the headers were parsed; the rest is the body
+            elapsed = min(response.elapsed.total_seconds(), total)
+            # some adapters (e.g. requests-file 1.x) set an int, not a str
+            try:
+                nbytes = int(response.headers.get('Content-Length'))
+            except (TypeError, ValueError):
+                nbytes = None
+            self._emit('request', elapsed, url=url, attempt=attempt,
+                       status=response.status_code)
+            if not kwargs.get('stream'):
+                self._emit('transfer', total - elapsed, url=url,
+                           attempt=attempt, nbytes=nbytes,
+                           status=response.status_code)
+        return response
+
+    def _emit(self, phase, duration, **kwargs):
+        _emit(self.hooks, self.__class__.__name__, phase, duration, **kwargs)
+
+    def _compact(self, df):
+        """
+        Apply the compact schema to ``df`` if ``compact`` is set
+        """
+        if not self.compact:
+            return df
+        return _compact_frame(df, self._compact_dtypes)
+
     def _get_crumb(self, *args):
         """ To be implemented by subclass """
         raise NotImplementedError("Subclass has not implemented method.")
 
     def _read_lines(self, out):
+        if self._schema is not None:
+            try:
+                return self._read_schema_lines(out)
+            except (ValueError, KeyError, IndexError):
+                # the response does not have the expected layout
+                out.seek(0)
         rs = read_csv(out, index_col=0, parse_dates=True,
                       na_values=('-', 'null'))[::-1]
         # Yahoo! Finance sometimes does this awesome thing where they
         # return 2 rows for the most recent business day
         if len(rs) > 2 and rs.index[-1] == rs.index[-2]:  # pragma: no cover
             rs = rs[:-1]
-        # Get rid of unicode characters in index name.
-        try:
-            rs.index.name = rs.index.name.decode(
-                'unicode_escape').encode('ascii', 'ignore')
-        except AttributeError:
-            # Python 3 string has no decode method.
-            rs.index.name = rs.index.name.encode('ascii', 'ignore').decode()
+        rs.index.name = _ascii_name(rs.index.name)
+        return rs
+
+    def _read_schema_lines(self, out):
+        """
+        Parse a CSV response with the layout given by ``_schema``: the first
+        column holds dates in ``date_format``, the others have known dtypes.
+        Rows are returned in ascending date order.
+        """
+        rs = read_csv(out, index_col=0, dtype=self._schema['dtype'],
+                      na_values=('-', 'null'))
+        name = _ascii_name(rs.index.name)
+        rs.index = to_datetime(rs.index, format=self._schema['date_format'])
+        rs.index.name = name
+        stamps = rs.index.asi8
+        if len(stamps) > 1 and stamps[0] > stamps[-1]:
+            # newest first: reverse (this copies); ascending data is kept
+            rs = rs.iloc[::-1]
+            stamps = stamps[::-1]
+        # Yahoo! Finance sometimes returns 2 rows for the most recent
+        # business day
+        if len(stamps) > 2 and stamps[-1] == stamps[-2]:  # pragma: no cover
+            rs = rs.iloc[:-1]
         return rs
 
 
@@ -217,6 +334,17 @@ class _DailyBaseReader(_BaseReader):
             raise RemoteDataError(msg.format(self.__class__.__name__))
 
 
+def _ascii_name(name):
+    """
+    Return ``name`` without non-ASCII characters, e.g. a byte order mark
+    """
+    try:
+        return name.decode('unicode_escape').encode('ascii', 'ignore')
+    except AttributeError:
+        # Python 3 string has no decode method.
+        return name.encode('ascii', 'ignore').decode()
+
+
 def _in_chunks(seq, size):
     """
     Return sequence in 'chunks' of size defined by size
@@ -226,11 +354,19 @@ def _in_chunks(seq, size):
 
 class _OptionBaseReader(_BaseReader):
 
-    def __init__(self, symbol, session=None):
+    _compact_dtypes = {'Last': 'float32', 'Bid': 'float32',
+                       'Ask': 'float32', 'Chg': 'float32',
+                       'PctChg': 'float32', 'Vol': 'float32',
+                       'Open_Int': 'float32', 'IV': 'float32',
+                       'Root': 'category', 'Underlying': 'category',
+                       'Underlying_Price': 'float32'}
+
+    def __init__(self, symbol, session=None, compact=False):
         """ Instantiates options_data with a ticker saved as symbol """
         self.symbol = symbol.upper()
         super(_OptionBaseReader, self).__init__(symbols=symbol,
-                                                session=session)
+                                                session=session,
+                                                compact=compact)
 
     def get_options_data(self, month=None, year=None, expiry=None):
         """
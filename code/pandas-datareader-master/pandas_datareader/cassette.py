@@ -0,0 +1,191 @@
+"""
+Record and replay HTTP/FTP exchanges of readers.
+
+A ``CassetteAdapter`` mounted on a session stores every response it passes
+through in a cassette directory, or serves responses from that directory
+without any network access. Replayed responses can be delayed and
+throttled to simulate a given latency and bandwidth, so that readers can be
+tested and benchmarked deterministically offline.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pandas_datareader._utils import _init_session
+
+# headers describing the transfer rather than the (stored, decoded) body
+_TRANSFER_HEADERS = ('content-encoding', 'transfer-encoding',
+                     'content-length')
+
+
+class _ThrottledBody(object):
+    """
+    File-like body delivering ``data`` at most at ``bandwidth`` bytes/s
+    """
+
+    def __init__(self, data, bandwidth=None):
+        self._data = data
+        self._pos = 0
+        self._bandwidth = bandwidth
+
+    def read(self, size=-1, **kwargs):
+        if size is None or size < 0:
+            size = len(self._data) - self._pos
+        chunk = self._data[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        if chunk and self._bandwidth:
+            time.sleep(len(chunk) / float(self._bandwidth))
+        return chunk
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter recording to or replaying from a cassette directory
+
+    Parameters
+    ----------
+    directory : str
+        cassette directory, one ``<key>.json`` and ``<key>.body`` per request
+    mode : {'replay', 'record', 'once'}, default 'replay'
+        'replay' serves stored responses only and fails for unknown
+        requests, 'record' always goes to the network and stores the
+        response, 'once' replays what is stored and records the rest
+    upstream : BaseAdapter, optional
+        adapter used to reach the network when recording (``HTTPAdapter``
+        by default)
+    latency : float, default 0
+        seconds to wait before a replayed response arrives
+    bandwidth : float, optional
+        bytes per second at which a replayed body is delivered
+    ignore_params : sequence of str, default ('crumb',)
+        query parameters left out when matching requests, e.g. session
+        tokens that differ between recording and replay
+    """
+
+    def __init__(self, directory, mode='replay', upstream=None, latency=0.,
+                 bandwidth=None, ignore_params=('crumb',)):
+        super(CassetteAdapter, self).__init__()
+        if mode not in ('replay', 'record', 'once'):
+            raise ValueError("mode must be 'replay', 'record' or 'once', "
+                             "not %r" % (mode,))
+        if mode != 'replay' and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.mode = mode
+        self.upstream = upstream if upstream is not None else HTTPAdapter()
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.ignore_params = set(ignore_params)
+        self._lock = threading.Lock()
+
+    def key(self, request):
+        """
+        Return the name under which the exchange of ``request`` is stored
+        """
+        url = requests.utils.urlparse(request.url)
+        query = sorted(param for param in url.query.split('&')
+                       if param and
+                       param.split('=')[0] not in self.ignore_params)
+        body = request.body or b''
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        digest = hashlib.sha1()
+        for part in [request.method, url.scheme, url.netloc, url.path,
+                     '&'.join(query)]:
+            digest.update(part.encode('utf-8') + b'\n')
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _path(self, key, ext):
+        return os.path.join(self.directory, key + ext)
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        key = self.key(request)
+        recorded = os.path.exists(self._path(key, '.json'))
+        if self.mode == 'record' or (self.mode == 'once' and not recorded):
+            response = self.upstream.send(request, stream=False,
+                                          timeout=timeout, verify=verify,
+                                          cert=cert, proxies=proxies)
+            self._record(key, request, response)
+        elif not recorded:
+            raise requests.ConnectionError(
+                'No recording of %s %s in %s' % (request.method, request.url,
+                                                 self.directory),
+                request=request)
+        if self.latency:
+            time.sleep(self.latency)
+        return self._replay(key, request)
+
+    def _record(self, key, request, response):
+        headers = dict((k, v) for k, v in response.headers.items()
+                       if k.lower() not in _TRANSFER_HEADERS)
+        meta = {'method': request.method, 'url': request.url,
+                'status_code': response.status_code,
+                'reason': response.reason, 'headers': headers,
+                'encoding': response.encoding}
+        with self._lock:
+            with open(self._path(key, '.body'), 'wb') as f:
+                f.write(response.content)
+            # written last: its presence marks a complete recording
+            with open(self._path(key, '.json'), 'w') as f:
+                json.dump(meta, f, indent=1, sort_keys=True)
+
+    def _replay(self, key, request):
+        with open(self._path(key, '.json')) as f:
+            meta = json.load(f)
+        with open(self._path(key, '.body'), 'rb') as f:
+            body = f.read()
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response.reason = meta['reason']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.headers['Content-Length'] = str(len(body))
+        response.encoding = meta['encoding']
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _ThrottledBody(body, self.bandwidth)
+        return response
+
+    def close(self):
+        self.upstream.close()
+
+
+def mount_cassette(directory, session=None, mode='replay', latency=0.,
+                   bandwidth=None, ignore_params=('crumb',)):
+    """
+    Return ``session`` (a new one if None) with HTTP(S) and FTP requests
+    going through ``CassetteAdapter`` objects on ``directory``; the other
+    arguments are those of ``CassetteAdapter``.
+
+    Examples
+    --------
+    # record once with network access ...
+    session = mount_cassette('cassettes/fred', mode='record')
+    FredReader(['GDP', 'CPIAUCSL'], session=session).read()
+    # ... then replay offline at 50ms latency and 1MB/s
+    session = mount_cassette('cassettes/fred', latency=0.05, bandwidth=1e6)
+    FredReader(['GDP', 'CPIAUCSL'], session=session).read()
+    """
+    session = _init_session(session)
+    for prefix in ['http://', 'https://', 'ftp://']:
+        upstream = session.get_adapter(prefix)
+        session.mount(prefix, CassetteAdapter(directory, mode=mode,
+                                              upstream=upstream,
+                                              latency=latency,
+                                              bandwidth=bandwidth,
+                                              ignore_params=ignore_params))
+    return session
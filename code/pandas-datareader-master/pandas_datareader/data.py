@@ -2,62 +2,122 @@
 Module contains tools for collecting data from various remote sources
 """
 
+import sys
+import types
 import warnings
+from importlib import import_module
+
+from pandas_datareader.registry import (DataSource,  # noqa
+                                        available_sources, get_source,
+                                        register_source)
+
+# Readers are imported on first use: each source pulls in its own parsing
+# dependencies (lxml, ftplib/zipfile, json, ...), which short-lived
+# processes that touch only one source should not have to pay for. The
+# readers of a ``data_source`` are located through the registry, the others
+# here.
+_READERS = {
+    'GoogleQuotesReader': ('pandas_datareader.google.quotes',
+                           'GoogleQuotesReader'),
+    'GoogleOptions': ('pandas_datareader.google.options', 'Options'),
+    'YahooQuotesReader': ('pandas_datareader.yahoo.quotes',
+                          'YahooQuotesReader'),
+    'YahooOptions': ('pandas_datareader.yahoo.options', 'Options'),
+    '_get_components_yahoo': ('pandas_datareader.yahoo.components',
+                              '_get_data'),
+}
+
+
+def _source_of(name):
+    """
+    Return the registered source whose reader is called ``name``, or None.
+    """
+    for source_name in available_sources():
+        source = get_source(source_name)
+        if source.reader_name == name:
+            return source
+    return None
+
+
+def _reader(name):
+    """
+    Return the reader called ``name``, importing its module on first use
+    and caching it as an attribute of this module.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    if name in _READERS:
+        module, attr = _READERS[name]
+        obj = getattr(import_module(module), attr)
+    else:
+        obj = _source_of(name).reader
+    globals()[name] = obj
+    # the module in sys.modules is a _DataModule with its own namespace
+    setattr(sys.modules[__name__], name, obj)
+    return obj
+
+
+class _DataModule(types.ModuleType):
+    """
+    This module, with readers imported on attribute access; keeps
+    ``from pandas_datareader.data import FredReader`` working without
+    importing every reader (module ``__getattr__`` needs Python 3.7).
+    """
+
+    def __getattr__(self, name):
+        if name in _READERS or _source_of(name) is not None:
+            return _reader(name)
+        raise AttributeError("module %r has no attribute %r"
+                             % (__name__, name))
+
 
-from pandas_datareader.google.daily import GoogleDailyReader
-from pandas_datareader.google.quotes import GoogleQuotesReader
+def get_components_yahoo(idx_sym):
+    return _reader('_get_components_yahoo')(idx_sym)
 
-from pandas_datareader.yahoo.daily import YahooDailyReader
-from pandas_datareader.yahoo.quotes import YahooQuotesReader
-from pandas_datareader.yahoo.actions import (YahooActionReader, YahooDivReader)
-from pandas_datareader.yahoo.components import _get_data as get_components_yahoo  # noqa
-from pandas_datareader.yahoo.options import Options as YahooOptions
-from pandas_datareader.google.options import Options as GoogleOptions
 
-from pandas_datareader.eurostat import EurostatReader
-from pandas_datareader.fred import FredReader
-from pandas_datareader.famafrench import FamaFrenchReader
-from pandas_datareader.oecd import OECDReader
-from pandas_datareader.edgar import EdgarIndexReader
-from pandas_datareader.enigma import EnigmaReader
-from pandas_datareader.nasdaq_trader import get_nasdaq_symbols
-from pandas_datareader.quandl import QuandlReader
+def get_nasdaq_symbols(retry_count=3, timeout=30, pause=None,
+                       compact=False):
+    return get_source('nasdaq').reader(retry_count=retry_count,
+                                       timeout=timeout, pause=pause,
+                                       compact=compact)
 
 
 def get_data_fred(*args, **kwargs):
-    return FredReader(*args, **kwargs).read()
+    return get_source('fred').reader(*args, **kwargs).read()
 
 
 def get_data_famafrench(*args, **kwargs):
-    return FamaFrenchReader(*args, **kwargs).read()
+    return get_source('famafrench').reader(*args, **kwargs).read()
 
 
 def get_data_google(*args, **kwargs):
-    return GoogleDailyReader(*args, **kwargs).read()
+    return get_source('google').reader(*args, **kwargs).read()
 
 
 def get_data_yahoo(*args, **kwargs):
-    return YahooDailyReader(*args, **kwargs).read()
+    return get_source('yahoo').reader(*args, **kwargs).read()
 
 
 def get_data_enigma(*args, **kwargs):
-    return EnigmaReader(*args, **kwargs).read()
+    return get_source('enigma').reader(*args, **kwargs).read()
 
 
 def get_data_yahoo_actions(*args, **kwargs):
-    return YahooActionReader(*args, **kwargs).read()
+    return get_source('yahoo-actions').reader(*args, **kwargs).read()
 
 
 def get_quote_yahoo(*args, **kwargs):
-    return YahooQuotesReader(*args, **kwargs).read()
+    return _reader('YahooQuotesReader')(*args, **kwargs).read()
 
 
 def get_quote_google(*args, **kwargs):
-    return GoogleQuotesReader(*args, **kwargs).read()
+    return _reader('GoogleQuotesReader')(*args, **kwargs).read()
 
 
 def get_data_quandl(*args, **kwargs):
-    return QuandlReader(*args, **kwargs).read()
+    return get_source('quandl').reader(*args, **kwargs).read()
 
 
 def DataReader(name, data_source=None, start=None, end=None,
@@ -75,7 +135,8 @@ def DataReader(name, data_source=None, start=None, end=None,
         accept a list of names.
     data_source: {str, None}
         the data source ("yahoo", "yahoo-actions", "yahoo-dividends",
-        "google", "fred", "ff", or "edgar-index")
+        "google", "fred", "ff", or "edgar-index"), or any other name in
+        ``available_sources()``; see ``register_source``
     start : {datetime, None}
         left boundary for range (defaults to 1/1/2010)
     end : {datetime, None}
@@ -113,76 +174,34 @@ def DataReader(name, data_source=None, start=None, end=None,
     # Data from EDGAR index
     ed = DataReader("full", "edgar-index")
     ed2 = DataReader("daily", "edgar-index")
-    """
-    if data_source == "yahoo":
-        return YahooDailyReader(symbols=name, start=start, end=end,
-                                adjust_price=False, chunksize=25,
-                                retry_count=retry_count, pause=pause,
-                                session=session).read()
-
-    elif data_source == "yahoo-actions":
-        return YahooActionReader(symbols=name, start=start, end=end,
-                                 retry_count=retry_count, pause=pause,
-                                 session=session).read()
-    elif data_source == "yahoo-dividends":
-        return YahooDivReader(symbols=name, start=start, end=end,
-                              adjust_price=False, chunksize=25,
-                              retry_count=retry_count, pause=pause,
-                              session=session, interval='d').read()
 
-    elif data_source == "google":
-        return GoogleDailyReader(symbols=name, start=start, end=end,
-                                 chunksize=25,
-                                 retry_count=retry_count, pause=pause,
-                                 session=session).read()
-
-    elif data_source == "enigma":
-        return EnigmaReader(datapath=name, api_key=access_key).read()
-
-    elif data_source == "fred":
-        return FredReader(symbols=name, start=start, end=end,
-                          retry_count=retry_count, pause=pause,
-                          session=session).read()
-
-    elif data_source == "famafrench":
-        return FamaFrenchReader(symbols=name, start=start, end=end,
-                                retry_count=retry_count, pause=pause,
-                                session=session).read()
-
-    elif data_source == "oecd":
-        return OECDReader(symbols=name, start=start, end=end,
-                          retry_count=retry_count, pause=pause,
-                          session=session).read()
-    elif data_source == "eurostat":
-        return EurostatReader(symbols=name, start=start, end=end,
-                              retry_count=retry_count, pause=pause,
-                              session=session).read()
-    elif data_source == "edgar-index":
-        return EdgarIndexReader(symbols=name, start=start, end=end,
-                                retry_count=retry_count, pause=pause,
-                                session=session).read()
-    elif data_source == 'nasdaq':
-        if name != 'symbols':
-            raise ValueError("Only the string 'symbols' is supported for "
-                             "Nasdaq, not %r" % (name,))
-        return get_nasdaq_symbols(retry_count=retry_count, pause=pause)
-    elif data_source == "quandl":
-        return QuandlReader(symbols=name, start=start, end=end,
-                            retry_count=retry_count, pause=pause,
-                            session=session).read()
-    else:
-        msg = "data_source=%r is not implemented" % data_source
-        raise NotImplementedError(msg)
+    # Data from an in-house source
+    register_source(DataSource("local", MyReader, multi_symbol=True))
+    df = DataReader(["A", "B"], "local")
+    """
+    source = get_source(data_source)
+    return source.read(name, start=start, end=end, retry_count=retry_count,
+                       pause=pause, session=session, access_key=access_key)
 
 
-def Options(symbol, data_source=None, session=None):
+def Options(symbol, data_source=None, session=None, compact=False):
     if data_source is None:
         warnings.warn("Options(symbol) is deprecated, use Options(symbol,"
                       " data_source) instead", FutureWarning, stacklevel=2)
         data_source = "yahoo"
     if data_source == "yahoo":
-        return YahooOptions(symbol, session=session)
+        return _reader('YahooOptions')(symbol, session=session,
+                                       compact=compact)
     elif data_source == "google":
-        return GoogleOptions(symbol, session=session)
+        return _reader('GoogleOptions')(symbol, session=session,
+                                        compact=compact)
     else:
         raise NotImplementedError("currently only yahoo and google supported")
+
+
+_module = _DataModule(__name__, __doc__)
+_module.__dict__.update(globals())
+# the functions above look up their globals in this module's namespace,
+# which Python 2 clears once nothing refers to the module any more
+_module._namespace = sys.modules[__name__]
+sys.modules[__name__] = _module
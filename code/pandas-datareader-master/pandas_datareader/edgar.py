@@ -9,7 +9,7 @@ from pandas import read_csv, DataFrame, to_datetime
 
 from pandas_datareader.base import _BaseReader
 from pandas_datareader._utils import RemoteDataError
-from pandas_datareader.compat import BytesIO, is_number
+from pandas_datareader.compat import BytesIO, is_number, PANDAS_0190
 
 
 _URL_FULL = 'edgar/full-index/master.zip'
@@ -19,6 +19,9 @@ _SEC_FTP = 'ftp.sec.gov'
 _COLUMNS = ['cik', 'company_name', 'form_type', 'date_filed', 'filename']
 _COLUMN_TYPES = {'cik': str, 'company_name': str, 'form_type': str,
                  'date_filed': str, 'filename': str}
+# company names, form types and dates repeat across filings
+_COMPACT_COLUMN_TYPES = {'cik': 'int32', 'company_name': 'category',
+                         'form_type': 'category', 'date_filed': 'category'}
 _DIVIDER = re.compile('--------------')
 _EDGAR = 'edgar/'
 _EDGAR_DAILY = 'edgar/daily-index'
@@ -39,12 +42,17 @@ class EdgarIndexReader(_BaseReader):
     """
     Get master index from the SEC's EDGAR database.
 
+    With ``compact=True`` the CIK is read as int32 and company name, form
+    type and filing date as categoricals.
+
     Returns
     -------
     edgar_index : pandas.DataFrame.
         DataFrame of EDGAR index.
     """
 
+    _compact_dtypes = _COMPACT_COLUMN_TYPES
+
     @property
     def url(self):
         if self.symbols == 'full':
@@ -103,11 +111,15 @@ class EdgarIndexReader(_BaseReader):
             index_file.seek(0)
 
         index_file = self._remove_header(index_file)
+        dtype = _COLUMN_TYPES
+        if self.compact and PANDAS_0190:
+            # categoricals are built by the parser
+            dtype = dict(_COLUMN_TYPES, **_COMPACT_COLUMN_TYPES)
         index = read_csv(index_file, delimiter='|', header=None,
                          index_col=False, names=_COLUMNS,
-                         low_memory=False, dtype=_COLUMN_TYPES)
+                         low_memory=False, dtype=dtype)
         index['filename'] = index['filename'].map(self._fix_old_file_paths)
-        return index
+        return self._compact(index)
 
     def _read_daily_data(self, url, params):
         doc_index = DataFrame()
@@ -117,6 +129,8 @@ class EdgarIndexReader(_BaseReader):
                 daily_idx_path = (idx_entry['path'] + '/' + idx_entry['name'])
                 daily_idx = self._read_one_data(daily_idx_path, params)
                 doc_index = doc_index.append(daily_idx)
+        # appending files with different categories falls back to object
+        doc_index = self._compact(doc_index)
         doc_index['date_filed'] = to_datetime(doc_index['date_filed'],
                                               format='%Y%m%d')
         doc_index.set_index(['date_filed', 'cik'], inplace=True)
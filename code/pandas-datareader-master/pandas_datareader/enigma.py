@@ -1,7 +1,7 @@
+import io
 import zlib
 import os
 import time
-from pandas.compat import StringIO
 
 import pandas.compat as compat
 import pandas as pd
@@ -31,6 +31,14 @@ class EnigmaReader(_BaseReader):
         df = EnigmaReader(datapath='enigma.inspections.restaurants.fl',
         ...               api_key='ARIAMFHKJMISF38UT').read()
     ```
+
+    The gzipped export is decompressed while it is downloaded. Large
+    exports can be processed in pieces with ``read_chunks``:
+    ```
+        reader = EnigmaReader(datapath='enigma.inspections.restaurants.fl')
+        for df in reader.read_chunks(chunksize=100000):
+            ...
+    ```
     """
 
     def __init__(self,
@@ -54,6 +62,8 @@ class EnigmaReader(_BaseReader):
             self._api_key = api_key
 
         self._datapath = datapath
+        self._export = None
+        self._poll_error = None
         if not isinstance(self._datapath, compat.string_types):
             raise ValueError(
                 "The Enigma datapath must be a string (ex: "
@@ -72,32 +82,43 @@ class EnigmaReader(_BaseReader):
     def _head_key(self):
         return 'head_url'
 
-    def _request(self, url):
+    def _request(self, url, stream=False):
         self.session.headers.update({'User-Agent': 'pandas-datareader'})
-        resp = self.session.get(url)
+        resp = self._send(url, stream=stream)
         resp.raise_for_status()
         return resp
 
-    def _decompress_export(self, compressed_export_data):
-        return zlib.decompress(compressed_export_data, 16 + zlib.MAX_WBITS)
+    def poll_export_url(self):
+        """
+        Checks once, without waiting, whether the export is ready.
+        Returns the export URL if it is and None otherwise, so that a
+        scheduler or event loop can poll on its own timer instead of
+        blocking a thread.
+        """
+        if self._export is None:
+            self._export = self._request(self.url).json()
+        try:
+            self._send(self._export[self._head_key],
+                       method='head').raise_for_status()
+        except requests.RequestException as e:
+            self._poll_error = e
+            return None
+        return self._export[self.export_key]
 
     def extract_export_url(self, delay=10, max_attempts=10):
         """
         Performs an HTTP HEAD request on 'head_url' until it returns a `200`.
         This allows the Enigma API time to export the requested data.
         """
-        resp = self._request(self.url)
         attempts = 0
         while True:
-            try:
-                requests.head(resp.json()[self._head_key]).raise_for_status()
-            except Exception as e:
-                attempts += 1
-                if attempts > max_attempts:
-                    raise e
-                time.sleep(delay)
-                continue
-            return resp.json()[self.export_key]
+            export_url = self.poll_export_url()
+            if export_url is not None:
+                return export_url
+            attempts += 1
+            if attempts > max_attempts:
+                raise self._poll_error
+            time.sleep(delay)
 
     def read(self):
         try:
@@ -105,8 +126,55 @@ class EnigmaReader(_BaseReader):
         finally:
             self.close()
 
+    def read_chunks(self, chunksize=100000):
+        """
+        Streams the export, yielding DataFrames of ``chunksize`` rows.
+        """
+        try:
+            for chunk in self._read_export(chunksize=chunksize):
+                yield chunk
+        finally:
+            self.close()
+
     def _read(self):
-        export_gzipped_req = self._request(self.extract_export_url())
-        decompressed_data = self._decompress_export(
-            export_gzipped_req.content).decode("utf-8")
-        return pd.read_csv(StringIO(decompressed_data))
+        return self._read_export()
+
+    def _read_export(self, chunksize=None):
+        export_gzipped_req = self._request(self.extract_export_url(),
+                                           stream=True)
+        stream = io.BufferedReader(
+            _GzipStream(export_gzipped_req.iter_content(self._chunk_size)))
+        return pd.read_csv(stream, encoding='utf-8', chunksize=chunksize)
+
+
+class _GzipStream(io.RawIOBase):
+    """
+    Read-only raw stream over an iterable of gzipped byte chunks,
+    decompressing only as much as each read needs.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._buffer = b''
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def _fill(self, size):
+        while not self._eof and len(self._buffer) < size:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._buffer += self._decompressor.flush()
+                self._eof = True
+            else:
+                self._buffer += self._decompressor.decompress(chunk)
+
+    def readinto(self, b):
+        self._fill(len(b))
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
@@ -1,7 +1,19 @@
+import threading
+
+import requests
 from pandas.core.common import is_list_like
-from pandas import concat, read_csv
+from pandas import concat, read_csv, to_datetime
+import numpy as np
 
 from pandas_datareader.base import _BaseReader
+from pandas_datareader._utils import _map_concurrent
+
+_DATE_FORMAT = '%Y-%m-%d'
+
+# Downloaded series keyed by URL, as (conditional request headers, series).
+# A series is only re-downloaded when FRED reports it changed.
+_series_cache = {}
+_series_cache_lock = threading.Lock()
 
 
 class FredReader(_BaseReader):
@@ -12,9 +24,13 @@ class FredReader(_BaseReader):
     Returns a DataFrame.
 
     If multiple names are passed for "series" then the index of the
-    DataFrame is the outer join of the indicies of each series.
+    DataFrame is the outer join of the indicies of each series. The series
+    are downloaded concurrently and the joined dates are parsed once.
     """
 
+    # Number of series downloaded at once
+    _max_workers = 8
+
     @property
     def url(self):
         return "http://research.stlouisfed.org/fred2/series/"
@@ -34,18 +50,62 @@ class FredReader(_BaseReader):
         urls = [self.url + '%s' % n + '/downloaddata/%s' % n + '.csv' for
                 n in names]
 
-        def fetch_data(url, name):
-            resp = self._read_url_as_StringIO(url)
-            data = read_csv(resp, index_col=0, parse_dates=True,
-                            header=None, skiprows=1, names=["DATE", name],
-                            na_values='.')
-            try:
-                return data.truncate(self.start, self.end)
-            except KeyError:  # pragma: no cover
-                if data.ix[3].name[7:12] == 'Error':
-                    raise IOError("Failed to get the data. Check that "
-                                  "{0!r} is a valid FRED series.".format(name))
-                raise
-        df = concat([fetch_data(url, n) for url, n in zip(urls, names)],
-                    axis=1, join='outer')
+        series = _map_concurrent(lambda args: self._fetch_series(*args),
+                                 zip(urls, names), self._max_workers)
+
+        # Dates are kept as ISO strings until here, so the outer join is a
+        # single sort of the labels and they are parsed once for all series.
+        # labels that are not strings (e.g. NaN for a missing date) would
+        # break the sort, so they are compared as strings as well
+        labels = np.unique(np.concatenate([np.asarray(s.index, dtype=str)
+                                           for s in series]))
+        labels = labels[(labels >= self.start.strftime(_DATE_FORMAT)) &
+                        (labels <= self.end.strftime(_DATE_FORMAT))]
+        try:
+            index = to_datetime(labels, format=_DATE_FORMAT)
+        except (TypeError, ValueError):
+            for s in series:
+                self._check_dates(s)
+            raise
+
+        df = concat([s.reindex(labels) for s in series], axis=1)
+        df.index = index
+        df.index.name = 'DATE'
         return df
+
+    def _fetch_series(self, url, name):
+        """
+        Download one series as a Series indexed by date strings, reusing the
+        cached copy if the server reports it has not changed.
+        """
+        cached = None
+        if self._cacheable:
+            with _series_cache_lock:
+                cached = _series_cache.get(url)
+        headers = cached[0] if cached is not None else None
+
+        response = self._get_response(url, headers=headers)
+        if response.status_code == requests.codes.not_modified:
+            return cached[1].rename(name)
+
+        resp = self._response_as_StringIO(response)
+        data = read_csv(resp, index_col=0, header=None, skiprows=1,
+                        names=["DATE", name], na_values='.',
+                        dtype={'DATE': str})[name]
+
+        validators = {}
+        if 'ETag' in response.headers:
+            validators['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if validators and self._cacheable:
+            with _series_cache_lock:
+                _series_cache[url] = (validators, data)
+        return data
+
+    def _check_dates(self, series):
+        try:
+            to_datetime(series.index, format=_DATE_FORMAT)
+        except (TypeError, ValueError):
+            raise IOError("Failed to get the data. Check that {0!r} is "
+                          "a valid FRED series.".format(series.name))
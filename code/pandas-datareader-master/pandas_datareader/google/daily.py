@@ -29,6 +29,11 @@ class GoogleDailyReader(_DailyBaseReader):
         requests.sessions.Session instance to be used
     """
 
+    # e.g. 3-Jan-17, newest first; Volume is inferred as it may be '-'
+    _schema = {'date_format': '%d-%b-%y',
+               'dtype': {'Open': 'float64', 'High': 'float64',
+                         'Low': 'float64', 'Close': 'float64'}}
+
     @property
     def url(self):
         return 'http://finance.google.com/finance/historical'
@@ -148,7 +148,7 @@ class Options(_OptionBaseReader):
         df['Vol'] = df['Vol'].astype('float64')
         df['Open_Int'] = df['Open_Int'].astype('float64')
 
-        return df.sort_index()
+        return self._compact(df.sort_index())
 
     def _process_rows(self, jd, now, expiry):
         rows_list = []
@@ -0,0 +1,175 @@
+"""
+Instrumentation of reader requests.
+
+Readers report each phase of a read as a ``Span`` to the hooks registered
+globally with ``add_hook`` and to those in the ``hooks`` list of the reader.
+A hook is any callable taking a ``Span``; ``LatencyAggregator`` is a hook
+that builds per-source latency histograms.
+"""
+import threading
+from timeit import default_timer as _clock  # noqa
+
+import numpy as np
+from pandas import DataFrame, MultiIndex
+
+_HOOKS = []
+
+PHASES = ('request', 'transfer', 'retry', 'decode', 'parse')
+
+
+class Span(object):
+    """
+    Timing of one phase of a read
+
+    Attributes
+    ----------
+    source : str
+        class name of the reader
+    phase : str
+        'request' (connect, send and wait for the response headers),
+        'transfer' (download of the body, unless the response is streamed),
+        'retry' (pause before the next attempt), 'decode' (body to text) or
+        'parse' (text or JSON to DataFrame)
+    duration : float
+        seconds spent in the phase
+    url : str or None
+    attempt : int
+        0 for the first attempt, n for the n-th retry
+    nbytes : int or None
+        bytes received ('request'/'transfer', from the Content-Length header)
+        or decoded ('decode')
+    status : int or None
+        HTTP status code
+    error : Exception or None
+        the exception that ended the phase, if any
+    """
+
+    __slots__ = ('source', 'phase', 'duration', 'url', 'attempt', 'nbytes',
+                 'status', 'error')
+
+    def __init__(self, source, phase, duration, url=None, attempt=0,
+                 nbytes=None, status=None, error=None):
+        self.source = source
+        self.phase = phase
+        self.duration = duration
+        self.url = url
+        self.attempt = attempt
+        self.nbytes = nbytes
+        self.status = status
+        self.error = error
+
+    def __repr__(self):
+        return ('Span(source=%r, phase=%r, duration=%.6f, attempt=%d, '
+                'nbytes=%r, status=%r)' % (self.source, self.phase,
+                                           self.duration, self.attempt,
+                                           self.nbytes, self.status))
+
+
+def add_hook(hook):
+    """ Call ``hook(span)`` for every span emitted by any reader """
+    _HOOKS.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    """ Stop calling a hook registered with ``add_hook`` """
+    _HOOKS.remove(hook)
+
+
+def _active(hooks):
+    return bool(_HOOKS) or bool(hooks)
+
+
+def _emit(hooks, source, phase, duration, **kwargs):
+    if not _active(hooks):
+        return
+    span = Span(source, phase, duration, **kwargs)
+    for hook in _HOOKS + list(hooks):
+        hook(span)
+
+
+class LatencyAggregator(object):
+    """
+    Hook collecting per-source, per-phase latency histograms
+
+    Parameters
+    ----------
+    bounds : sequence of float, optional
+        upper bounds in seconds of the histogram buckets; a last bucket
+        collects everything above. Defaults to 1ms to 64s in powers of two.
+
+    Examples
+    --------
+    agg = add_hook(LatencyAggregator())
+    DataReader(['AAPL', 'MSFT'], 'yahoo')
+    agg.summary()
+    """
+
+    def __init__(self, bounds=None):
+        if bounds is None:
+            bounds = 0.001 * 2. ** np.arange(17)
+        self.bounds = np.asarray(bounds, dtype=float)
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._stats = {}
+
+    def __call__(self, span):
+        key = (span.source, span.phase)
+        bucket = np.searchsorted(self.bounds, span.duration)
+        with self._lock:
+            if key not in self._counts:
+                self._counts[key] = np.zeros(len(self.bounds) + 1, int)
+                # count, total seconds, total bytes, errors
+                self._stats[key] = [0, 0., 0, 0]
+            self._counts[key][bucket] += 1
+            stats = self._stats[key]
+            stats[0] += 1
+            stats[1] += span.duration
+            stats[2] += span.nbytes or 0
+            stats[3] += span.error is not None
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._stats.clear()
+
+    def histogram(self):
+        """
+        Return the bucket counts, one row per (source, phase) and one column
+        per bucket upper bound (``inf`` for the last bucket)
+        """
+        with self._lock:
+            keys = sorted(self._counts)
+            counts = [self._counts[key].copy() for key in keys]
+        columns = np.append(self.bounds, np.inf)
+        if not keys:
+            return DataFrame(columns=columns, dtype=int)
+        index = MultiIndex.from_tuples(keys, names=['source', 'phase'])
+        return DataFrame(np.vstack(counts), index=index, columns=columns)
+
+    def quantile(self, counts, q):
+        """
+        Upper bound of the bucket holding quantile ``q`` of ``counts``
+        """
+        cum = np.cumsum(counts)
+        bucket = np.searchsorted(cum, q * cum[-1])
+        return np.append(self.bounds, np.inf)[bucket]
+
+    def summary(self):
+        """
+        Return count, mean, estimated 50/90/99% quantiles, bytes and errors
+        per (source, phase)
+        """
+        with self._lock:
+            keys = sorted(self._counts)
+            rows = [(list(self._stats[key]), self._counts[key].copy())
+                    for key in keys]
+        data = [(stats[0], stats[1] / stats[0],
+                 self.quantile(counts, 0.5), self.quantile(counts, 0.9),
+                 self.quantile(counts, 0.99), stats[2], stats[3])
+                for stats, counts in rows]
+        columns = ['count', 'mean', 'p50', 'p90', 'p99', 'bytes', 'errors']
+        if not keys:
+            return DataFrame(columns=columns)
+        index = MultiIndex.from_tuples(keys, names=['source', 'phase'])
+        return DataFrame(data, index=index, columns=columns)
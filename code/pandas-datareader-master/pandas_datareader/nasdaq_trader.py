@@ -1,6 +1,6 @@
 from ftplib import FTP, all_errors
 from pandas import read_csv
-from pandas_datareader._utils import RemoteDataError
+from pandas_datareader._utils import RemoteDataError, _compact_frame
 from pandas.compat import StringIO
 
 import time
@@ -21,6 +21,7 @@ _TICKER_DTYPE = [('Nasdaq Traded', bool),
                  ('NASDAQ Symbol', str),
                  ('NextShares', bool)]
 _CATEGORICAL = ('Listing Exchange', 'Financial Status')
+_COMPACT_DTYPES = {'Market Category': 'category', 'Round Lot Size': 'float32'}
 
 _DELIMITER = '|'
 _ticker_cache = None
@@ -74,10 +75,14 @@ def _download_nasdaq_symbols(timeout):
     return data
 
 
-def get_nasdaq_symbols(retry_count=3, timeout=30, pause=None):
+def get_nasdaq_symbols(retry_count=3, timeout=30, pause=None,
+                       compact=False):
     """
     Get the list of all available equity symbols from Nasdaq.
 
+    With ``compact=True`` the market category is returned as a categorical
+    and the round lot size as float32.
+
     Returns
     -------
     nasdaq_tickers : pandas.DataFrame
@@ -106,4 +111,6 @@ def get_nasdaq_symbols(retry_count=3, timeout=30, pause=None):
                     retry_count -= 1
                     time.sleep(pause)
 
+    if compact:
+        return _compact_frame(_ticker_cache.copy(), _COMPACT_DTYPES)
     return _ticker_cache
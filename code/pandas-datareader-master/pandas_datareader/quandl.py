@@ -1,6 +1,17 @@
 import re
+import warnings
+
+import pandas.compat as compat
+from pandas import DataFrame, concat
 
 from pandas_datareader.base import _DailyBaseReader
+from pandas_datareader._utils import (RemoteDataError, SymbolWarning,
+                                      _map_concurrent)
+
+# DB/SYM, SYM.CC or a bare SYM
+_SYMBOL_RE = re.compile(r"(?:([A-Z0-9]+)(([/\.])([A-Z0-9_]+))?)\Z")
+# characters dropped from Quandl column names, e.g. 'Adj. Close' -> AdjClose
+_COLUMN_RE = re.compile(r"[ ./%()'\-]")
 
 
 class QuandlReader(_DailyBaseReader):
@@ -13,7 +24,7 @@ class QuandlReader(_DailyBaseReader):
 
     Parameters
     ----------
-    symbols : string
+    symbols : string or list of strings
         Possible formats:
         1. DB/SYM: The Quandl 'codes': DB is the database name,
         SYM is a ticker-symbol-like Quandl abbreviation
@@ -21,8 +32,8 @@ class QuandlReader(_DailyBaseReader):
         2. SYM.CC: SYM is the same symbol and CC is an ISO country code,
         will try to map to the best single Quandl database for that country.
         Beware of ambiguous symbols (different securities per country)!
-        Note: Cannot use more than a single string because of the inflexible
-        way the URL is composed of url and _get_params in the superclass
+        A list of symbols is downloaded concurrently and returned as one
+        long-format DataFrame with a 'Symbol' column.
     start : string
         Starting date, timestamp. Parses many different kind of date
         representations (e.g., 'JAN-01-2010', '1/1/10', 'Jan, 1, 1980')
@@ -41,11 +52,20 @@ class QuandlReader(_DailyBaseReader):
 
     _BASE_URL = "https://www.quandl.com/api/v3/datasets/"
 
+    # Number of datasets downloaded at once
+    _max_workers = 8
+
     @property
     def url(self):
         symbol = self.symbols if isinstance(self.symbols, str) \
                               else self.symbols[0]
-        mm = self._fullmatch(r"([A-Z0-9]+)(([/\.])([A-Z0-9_]+))?", symbol)
+        return self._dataset_url(*self._parse_symbol(symbol))
+
+    def _parse_symbol(self, symbol):
+        """
+        Split a symbol into its (dataset, symbol) pair.
+        """
+        mm = _SYMBOL_RE.match(symbol)
         assert mm, ("Symbol '%s' must conform to Quandl convention 'DB/SYM'" %
                     symbol)
         datasetname = 'WIKI'
@@ -60,6 +80,9 @@ class QuandlReader(_DailyBaseReader):
             # secondary convention SYM.CountryCode:
             symbol = mm.group(1)
             datasetname = self._db_from_countrycode(mm.group(4))
+        return datasetname, symbol
+
+    def _dataset_url(self, datasetname, symbol):
         params = {
             'start_date': self.start.strftime('%Y-%m-%d'),
             'end_date': self.end.strftime('%Y-%m-%d'),
@@ -69,10 +92,6 @@ class QuandlReader(_DailyBaseReader):
         return '%s%s/%s.csv?%s' % (self._BASE_URL, datasetname,
                                    symbol, paramstring)
 
-    def _fullmatch(self, regex, string, flags=0):
-        """Emulate python-3.4 re.fullmatch()."""
-        return re.match("(?:" + regex + r")\Z", string, flags=flags)
-
     _COUNTRYCODE_TO_DATASET = dict(
             # https://www.quandl.com/data/EURONEXT-Euronext-Stock-Exchange
             BE='EURONEXT',
@@ -102,14 +121,46 @@ class QuandlReader(_DailyBaseReader):
         return {}
 
     def read(self):
-        df = super(QuandlReader, self).read()
-        df.rename(columns=lambda n: n.replace(' ', '')
-                                     .replace('.', '')
-                                     .replace('/', '')
-                                     .replace('%', '')
-                                     .replace('(', '')
-                                     .replace(')', '')
-                                     .replace("'", '')
-                                     .replace('-', ''),
-                  inplace=True)
+        if isinstance(self.symbols, compat.string_types):
+            df = super(QuandlReader, self).read()
+        else:
+            try:
+                df = self._read_datasets(self.symbols)
+            finally:
+                self.close()
+        df.rename(columns=_normalize_column, inplace=True)
         return df
+
+    def _read_datasets(self, symbols):
+        """
+        Download one dataset per symbol concurrently and stack them into a
+        long-format DataFrame with a 'Symbol' column. Symbols that cannot be
+        read are left out with a SymbolWarning.
+        """
+        if isinstance(symbols, DataFrame):
+            symbols = symbols.index
+        symbols = list(symbols)
+
+        def read_symbol(sym):
+            try:
+                url = self._dataset_url(*self._parse_symbol(sym))
+                return self._read_one_data(url, None)
+            except (IOError, AssertionError):
+                msg = 'Failed to read symbol: {0!r}, dropping it.'
+                warnings.warn(msg.format(sym), SymbolWarning)
+                return None
+
+        frames = _map_concurrent(read_symbol, symbols, self._max_workers)
+        passed = []
+        for sym, df in zip(symbols, frames):
+            if df is not None:
+                df.insert(0, 'Symbol', sym)
+                passed.append(df)
+        if len(passed) == 0:
+            msg = "No data fetched using {0!r}"
+            raise RemoteDataError(msg.format(self.__class__.__name__))
+        return concat(passed)
+
+
+def _normalize_column(name):
+    return _COLUMN_RE.sub('', name)
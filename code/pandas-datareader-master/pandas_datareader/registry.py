@@ -0,0 +1,232 @@
+"""
+Registry of the data sources that ``DataReader`` can read from.
+
+Each source declares what its upstream supports, so that ``DataReader`` (and
+batch tooling built on ``get_source``) can choose batch sizes, concurrency
+and request pacing per source. Custom sources are added with
+``register_source``.
+"""
+from importlib import import_module
+
+try:
+    _string_types = (basestring,)  # noqa
+except NameError:
+    _string_types = (str,)
+
+
+class DataSource(object):
+    """
+    A data source and the capabilities of its upstream.
+
+    Parameters
+    ----------
+    name : str
+        the value of ``data_source`` that selects this source
+    reader : class or str
+        reader class, or its location as ``'module:attribute'``; the module
+        is imported the first time the source is used
+    multi_symbol : bool, default False
+        whether one reader accepts a list of symbols; other sources raise
+        ``ValueError`` when given one
+    max_batch : int, optional
+        most symbols to request at once; passed to the reader as
+        ``chunksize``
+    rate_limit : float, optional
+        most requests per second the upstream accepts; the pause between
+        consecutive requests is raised to at least ``1 / rate_limit``
+    cacheable : bool, default True
+        whether responses may be served from a cache: a ``requests_cache``
+        session or a reader's own cache (e.g. FRED's ``ETag`` cache).
+        Readers of other sources always ask the upstream.
+    incremental : bool, default False
+        whether the upstream filters by ``start``/``end``, so that ``update``
+        reads only the dates after those already stored
+    max_workers : int, optional
+        most requests one reader may have in flight at once
+    kwargs : dict, optional
+        further keyword arguments passed to the reader
+    """
+
+    def __init__(self, name, reader, multi_symbol=False, max_batch=None,
+                 rate_limit=None, cacheable=True, incremental=False,
+                 max_workers=None, kwargs=None):
+        if max_batch is not None and max_batch < 1:
+            raise ValueError("'max_batch' must be positive")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("'rate_limit' must be positive")
+        self.name = name
+        self._reader = reader
+        self.multi_symbol = multi_symbol
+        self.max_batch = max_batch
+        self.rate_limit = rate_limit
+        self.cacheable = cacheable
+        self.incremental = incremental
+        self.max_workers = max_workers
+        self.kwargs = kwargs or {}
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.name)
+
+    @property
+    def reader(self):
+        """ the reader class, imported on first access """
+        if isinstance(self._reader, _string_types):
+            module, attr = self._reader.split(':')
+            self._reader = getattr(import_module(module), attr)
+        return self._reader
+
+    @property
+    def reader_name(self):
+        """ the attribute name of the reader, without importing it """
+        if isinstance(self._reader, _string_types):
+            return self._reader.split(':')[1]
+        return self._reader.__name__
+
+    def _pause(self, pause):
+        if self.rate_limit is None:
+            return pause
+        return max(pause or 0, 1. / self.rate_limit)
+
+    def create_reader(self, symbols, start=None, end=None, retry_count=3,
+                      pause=0.001, session=None, access_key=None):
+        """
+        Return a reader for ``symbols`` configured for this source
+        """
+        kwargs = dict(self.kwargs)
+        if self.max_batch is not None:
+            kwargs['chunksize'] = self.max_batch
+        reader = self.reader(symbols=symbols, start=start, end=end,
+                             retry_count=retry_count,
+                             pause=self._pause(pause), session=session,
+                             **kwargs)
+        if self.max_workers is not None:
+            reader._max_workers = self.max_workers
+        reader._cacheable = self.cacheable
+        return reader
+
+    def read(self, symbols, **kwargs):
+        """
+        Read ``symbols``; ``kwargs`` are those of ``create_reader``
+        """
+        if not self.multi_symbol and not isinstance(symbols, _string_types):
+            raise ValueError("data_source=%r reads one symbol at a time, "
+                             "not %r" % (self.name, symbols))
+        return self.create_reader(symbols, **kwargs).read()
+
+    def update(self, symbols, data, end=None, **kwargs):
+        """
+        Extend ``data``, an earlier date-indexed DataFrame read of
+        ``symbols``, up to ``end``.
+
+        Incremental sources read only the dates after the last one in
+        ``data``; other sources read the whole range again. ``kwargs`` are
+        those of ``create_reader``.
+        """
+        from pandas import Timedelta, Timestamp, concat
+        if len(data) == 0:
+            return self.read(symbols, end=end, **kwargs)
+        if not self.incremental:
+            return self.read(symbols, start=data.index[0], end=end, **kwargs)
+        start = data.index[-1] + Timedelta(days=1)
+        if end is not None and start > Timestamp(end):
+            return data
+        new = self.read(symbols, start=start, end=end, **kwargs)
+        return concat([data, new[new.index > data.index[-1]]])
+
+
+class _EnigmaSource(DataSource):
+
+    def create_reader(self, symbols, start=None, end=None, retry_count=3,
+                      pause=0.001, session=None, access_key=None):
+        # exports are polled, so keep the reader's own retries and pause
+        reader = self.reader(datapath=symbols, api_key=access_key)
+        reader._cacheable = self.cacheable
+        return reader
+
+
+class _NasdaqSource(DataSource):
+
+    def read(self, symbols, retry_count=3, pause=0.001, **kwargs):
+        if symbols != 'symbols':
+            raise ValueError("Only the string 'symbols' is supported for "
+                             "Nasdaq, not %r" % (symbols,))
+        return self.reader(retry_count=retry_count,
+                           pause=self._pause(pause))
+
+
+_SOURCES = {}
+
+
+def register_source(source, overwrite=False):
+    """
+    Make ``source`` available as ``DataReader(..., data_source=source.name)``
+
+    Parameters
+    ----------
+    source : DataSource
+    overwrite : bool, default False
+        replace a source already registered under the same name
+    """
+    if not isinstance(source, DataSource):
+        raise TypeError("source must be a DataSource, not %r" % (source,))
+    if source.name in _SOURCES and not overwrite:
+        raise ValueError("data_source=%r is already registered"
+                         % source.name)
+    _SOURCES[source.name] = source
+    return source
+
+
+def unregister_source(name):
+    """ Remove the source registered as ``name`` """
+    return _SOURCES.pop(name)
+
+
+def get_source(name):
+    """ Return the source registered as ``name`` """
+    try:
+        return _SOURCES[name]
+    except KeyError:
+        raise NotImplementedError("data_source=%r is not implemented" % name)
+
+
+def available_sources():
+    """ Return the names of all registered sources """
+    return sorted(_SOURCES)
+
+
+# Rate limits: FRED allows 120 requests a minute and Quandl 300 per 10
+# seconds (with an API key); Yahoo! publishes none, so it is paced to 2 a
+# second. Yahoo! responses carry a crumb, Enigma exports are one-off URLs.
+for _source in [
+    DataSource('yahoo', 'pandas_datareader.yahoo.daily:YahooDailyReader',
+               multi_symbol=True, max_batch=25, rate_limit=2,
+               cacheable=False, incremental=True, max_workers=4,
+               kwargs={'adjust_price': False}),
+    DataSource('yahoo-actions',
+               'pandas_datareader.yahoo.actions:YahooActionReader',
+               multi_symbol=True, rate_limit=2, cacheable=False,
+               incremental=True, max_workers=4),
+    DataSource('yahoo-dividends',
+               'pandas_datareader.yahoo.actions:YahooDivReader',
+               multi_symbol=True, max_batch=25, rate_limit=2,
+               cacheable=False, incremental=True, max_workers=4,
+               kwargs={'adjust_price': False, 'interval': 'd'}),
+    DataSource('google', 'pandas_datareader.google.daily:GoogleDailyReader',
+               multi_symbol=True, max_batch=25, incremental=True),
+    _EnigmaSource('enigma', 'pandas_datareader.enigma:EnigmaReader',
+                  cacheable=False),
+    DataSource('fred', 'pandas_datareader.fred:FredReader',
+               multi_symbol=True, rate_limit=2, incremental=True,
+               max_workers=8),
+    DataSource('famafrench', 'pandas_datareader.famafrench:FamaFrenchReader'),
+    DataSource('oecd', 'pandas_datareader.oecd:OECDReader'),
+    DataSource('eurostat', 'pandas_datareader.eurostat:EurostatReader',
+               incremental=True),
+    DataSource('edgar-index', 'pandas_datareader.edgar:EdgarIndexReader'),
+    _NasdaqSource('nasdaq',
+                  'pandas_datareader.nasdaq_trader:get_nasdaq_symbols'),
+    DataSource('quandl', 'pandas_datareader.quandl:QuandlReader',
+               multi_symbol=True, rate_limit=30, incremental=True,
+               max_workers=8),
+]:
+    register_source(_source)
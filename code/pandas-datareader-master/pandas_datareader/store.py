@@ -0,0 +1,178 @@
+"""
+Store reader results as Parquet or Arrow IPC files and load them back.
+
+``to_store`` writes a DataFrame (daily bars, EDGAR indices, option chains,
+SDMX cubes, ...) together with metadata on where it came from. Arrow IPC
+files (``.arrow``/``.feather``) are memory-mapped by ``from_store``, so even
+large histories open without reading them into memory first. Parquet
+(``.parquet`` or a directory) is more compact and can be partitioned, e.g.
+by symbol.
+
+Requires pyarrow 1.0 or later, which in turn requires pandas 0.23 or later.
+"""
+import datetime as dt
+import json
+import os
+from distutils.version import LooseVersion
+
+from pandas import Panel
+
+_METADATA_KEY = b'pandas_datareader'
+_IPC_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+# IPC write options, to_pandas(split_blocks=...) and read_table(filters=...)
+_PYARROW_MIN_VERSION = '1.0.0'
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Please install pyarrow if you want to use "
+                          "to_store or from_store")
+    if LooseVersion(pyarrow.__version__) < LooseVersion(_PYARROW_MIN_VERSION):
+        raise ImportError("to_store and from_store require pyarrow >= {0}, "
+                          "not {1}".format(_PYARROW_MIN_VERSION,
+                                           pyarrow.__version__))
+    return pyarrow
+
+
+def _is_ipc(path):
+    return os.path.splitext(path)[1].lower() in _IPC_EXTENSIONS
+
+
+def _default(obj):
+    # dates and other values of request parameters
+    if isinstance(obj, (dt.date, dt.datetime)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def to_store(df, path, source=None, params=None, partition_on=None,
+             compression=None):
+    """
+    Write ``df`` with its provenance to a Parquet or Arrow IPC store
+
+    Parameters
+    ----------
+    df : DataFrame or Panel
+        reader result; a Panel is stored in long format (``to_frame``)
+    path : str
+        ``*.arrow``, ``*.feather`` or ``*.ipc`` for an Arrow IPC file, any
+        other path for Parquet (a directory if ``partition_on`` is given)
+    source : str, optional
+        data source or reader the data came from, e.g. 'yahoo'
+    params : dict, optional
+        request parameters, e.g. symbols, start and end
+    partition_on : list of str, optional
+        columns to partition a Parquet store by, one directory per value
+    compression : str, optional
+        compression codec; defaults to 'snappy' for Parquet and to none for
+        Arrow IPC, whose uncompressed columns can be memory-mapped without
+        copying ('lz4' and 'zstd' are supported)
+
+    Returns
+    -------
+    metadata : dict
+        the metadata stored with the data
+    """
+    pa = _import_pyarrow()
+    if isinstance(df, Panel):
+        df = df.to_frame()
+    metadata = {'source': source, 'params': params or {},
+                'fetched': dt.datetime.utcnow().isoformat()}
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[_METADATA_KEY] = json.dumps(metadata,
+                                                default=_default).encode()
+    table = table.replace_schema_metadata(schema_metadata)
+
+    if _is_ipc(path):
+        if partition_on:
+            raise ValueError("partition_on is only supported for Parquet")
+        options = None
+        if compression is not None:
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema,
+                                 options=options) as writer:
+                writer.write_table(table)
+    else:
+        import pyarrow.parquet as pq
+        compression = compression or 'snappy'
+        if partition_on:
+            pq.write_to_dataset(table, path, partition_cols=partition_on,
+                                compression=compression)
+            # the partitioned files do not carry the metadata of the table
+            pq.write_metadata(table.schema, os.path.join(path, '_metadata'))
+        else:
+            pq.write_table(table, path, compression=compression)
+    return metadata
+
+
+def _read_table(path, columns=None, filters=None, memory_map=True):
+    pa = _import_pyarrow()
+    if _is_ipc(path):
+        if filters is not None:
+            raise ValueError("filters are only supported for Parquet")
+        if memory_map:
+            source = pa.memory_map(path, 'r')
+        else:
+            source = pa.OSFile(path, 'rb')
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            # keep the index columns so that the index is restored
+            index = [col for col in table.schema.pandas_metadata[
+                'index_columns'] if not isinstance(col, dict)]
+            table = table.select(list(columns) + index)
+        return table
+    import pyarrow.parquet as pq
+    return pq.read_table(path, columns=columns, filters=filters,
+                         memory_map=memory_map)
+
+
+def from_store(path, columns=None, filters=None, memory_map=True):
+    """
+    Load a DataFrame written by ``to_store``
+
+    Parameters
+    ----------
+    path : str
+        file or directory written by ``to_store``
+    columns : list of str, optional
+        columns to load
+    filters : list of tuples, optional
+        Parquet row filters such as ``[('Symbol', 'in', ['AAPL', 'MSFT'])]``;
+        on partitioned stores whole partitions are skipped
+    memory_map : bool, default True
+        memory-map the file instead of reading it; numeric columns of an
+        uncompressed Arrow IPC file are then used without copying and are
+        read-only
+
+    Returns
+    -------
+    DataFrame
+    """
+    table = _read_table(path, columns=columns, filters=filters,
+                        memory_map=memory_map)
+    # one block per column, so numeric columns without nulls can share the
+    # memory-mapped buffers instead of being consolidated into a copy
+    return table.to_pandas(split_blocks=True)
+
+
+def store_metadata(path):
+    """
+    Return the metadata (source, params, fetched) written by ``to_store``
+    """
+    pa = _import_pyarrow()
+    if _is_ipc(path):
+        with pa.memory_map(path, 'r') as source:
+            schema = pa.ipc.open_file(source).schema
+    else:
+        import pyarrow.parquet as pq
+        if os.path.isdir(path):
+            path = os.path.join(path, '_metadata')
+        schema = pq.read_schema(path)
+    raw = (schema.metadata or {}).get(_METADATA_KEY)
+    if raw is None:
+        raise ValueError("%r was not written by to_store" % path)
+    return json.loads(raw.decode())
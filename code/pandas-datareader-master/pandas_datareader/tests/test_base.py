@@ -1,7 +1,16 @@
+import contextlib
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
 import pytest
 import requests
+from pandas.compat import StringIO
 
 import pandas_datareader.base as base
+from pandas_datareader._utils import _map_concurrent
+from pandas_datareader.google.daily import GoogleDailyReader
+from pandas_datareader.yahoo.daily import YahooDailyReader
 
 
 class TestBaseReader(object):
@@ -24,9 +33,125 @@ class TestBaseReader(object):
             b._format = 'IM_NOT_AN_IMPLEMENTED_TYPE'
             b._read_one_data('a', None)
 
+    @pytest.mark.parametrize('status, refreshes', [(401, 3), (403, 3),
+                                                   (404, 0), (500, 0)])
+    def test_crumb_refreshed_only_when_rejected(self, status, refreshes):
+        class _Session(object):
+            def get(self, url, **kwargs):
+                response = requests.Response()
+                response.status_code = status
+                return response
+
+        class _CrumbReader(base._BaseReader):
+            def _get_crumb(self, retries, stale=None):
+                crumbs.append(stale)
+                return 'new'
+
+        crumbs = []
+        reader = _CrumbReader([], retry_count=2, pause=0, session=_Session())
+        with pytest.raises(base.RemoteDataError):
+            reader._get_response('http://x', params={'crumb': 'old'})
+        assert len(crumbs) == refreshes
+
+    @pytest.mark.parametrize('headers, accepted', [
+        (None, False), ({'If-None-Match': '"1"'}, True),
+        ({'If-Modified-Since': 'Fri, 01 Jan 2010 00:00:00 GMT'}, True)])
+    def test_not_modified_needs_conditional_request(self, headers, accepted):
+        class _Session(object):
+            def get(self, url, **kwargs):
+                response = requests.Response()
+                response.status_code = 304
+                return response
+
+        reader = base._BaseReader([], retry_count=0, pause=0,
+                                  session=_Session())
+        if accepted:
+            response = reader._get_response('http://x', headers=headers)
+            assert response.status_code == 304
+        else:
+            with pytest.raises(base.RemoteDataError):
+                reader._get_response('http://x', headers=headers)
+
+    @pytest.mark.parametrize('cacheable', [True, False])
+    def test_cache_disabled_when_not_cacheable(self, cacheable):
+        class _CachedSession(object):
+            # the interface of a requests_cache.CachedSession
+            cached = True
+
+            @contextlib.contextmanager
+            def cache_disabled(self):
+                self.cached = False
+                yield
+                self.cached = True
+
+            def get(self, url, **kwargs):
+                response = requests.Response()
+                response.status_code = 200
+                response.from_cache = self.cached
+                return response
+
+        reader = base._BaseReader([], session=_CachedSession())
+        reader._cacheable = cacheable
+        assert reader._send('http://x').from_cache == cacheable
+
 
 class TestDailyBaseReader(object):
     def test_get_params(self):
         with pytest.raises(NotImplementedError):
             b = base._DailyBaseReader()
             b._get_params()
+
+
+class TestMapConcurrent(object):
+    def test_keeps_order(self):
+        result = _map_concurrent(lambda x: x * 2, range(20), max_workers=4)
+        assert result == [x * 2 for x in range(20)]
+
+    def test_raises(self):
+        def fail(x):
+            if x == 3:
+                raise IOError('failed')
+            return x
+
+        with pytest.raises(IOError):
+            _map_concurrent(fail, range(5), max_workers=2)
+
+
+class TestReadLinesSchema(object):
+
+    yahoo = ('Date,Open,High,Low,Close,Adj Close,Volume\n'
+             '2017-01-03,115.8,116.33,114.76,116.15,114.31,28781900\n'
+             '2017-01-04,115.85,116.51,115.75,116.02,114.18,21118100\n'
+             '2017-01-05,115.92,116.86,115.81,116.61,114.76,22193600\n')
+    google = (u'\ufeffDate,Open,High,Low,Close,Volume\n'
+              '5-Jan-17,115.92,116.86,115.81,116.61,22193587\n'
+              '4-Jan-17,115.85,116.51,115.75,116.02,-\n'
+              '3-Jan-17,115.80,116.33,114.76,116.15,28781865\n')
+
+    def _read(self, reader_class, text, schema=True):
+        reader = base._BaseReader([])
+        if schema:
+            reader._schema = reader_class._schema
+        return reader._read_lines(StringIO(text))
+
+    def test_yahoo(self):
+        rs = self._read(YahooDailyReader, self.yahoo)
+        assert rs.index.is_monotonic_increasing
+        assert rs.index.name == 'Date'
+        assert rs['Volume'].dtype == np.int64
+        expected = self._read(YahooDailyReader, self.yahoo, schema=False)
+        tm.assert_frame_equal(rs, expected.sort_index())
+
+    def test_google(self):
+        rs = self._read(GoogleDailyReader, self.google)
+        assert list(rs.index) == list(pd.date_range('2017-01-03', periods=3))
+        assert rs.index.name == 'Date'
+        assert np.isnan(rs['Volume'].iloc[1])
+        expected = self._read(GoogleDailyReader, self.google, schema=False)
+        tm.assert_frame_equal(rs, expected)
+
+    def test_unexpected_layout_falls_back(self):
+        text = 'Date,Dividends\n03/01/2017,0.57\n'
+        rs = self._read(YahooDailyReader, text)
+        assert rs.index[0] == pd.Timestamp('2017-03-01')
+        assert rs['Dividends'].iloc[0] == 0.57
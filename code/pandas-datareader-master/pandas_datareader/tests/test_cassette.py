@@ -0,0 +1,79 @@
+import time
+
+import pytest
+import requests
+from requests_file import FileAdapter
+
+from pandas_datareader.cassette import CassetteAdapter, mount_cassette
+
+
+def _session(adapter):
+    session = requests.Session()
+    session.mount('file://', adapter)
+    return session
+
+
+class TestCassette(object):
+
+    def setup_method(self, method):
+        self.body = b'Date,Value\n2017-01-02,1.0\n' * 1000
+
+    def test_record_and_replay(self, tmpdir):
+        source = tmpdir.join('data.csv')
+        source.write_binary(self.body)
+        url = 'file://' + str(source)
+        cassette = str(tmpdir.join('cassette'))
+
+        recorder = CassetteAdapter(cassette, mode='record',
+                                   upstream=FileAdapter())
+        assert _session(recorder).get(url).content == self.body
+        source.remove()
+
+        player = CassetteAdapter(cassette)
+        response = _session(player).get(url)
+        assert response.status_code == 200
+        assert response.content == self.body
+        assert response.headers['Content-Length'] == str(len(self.body))
+        # streamed consumption replays the same body
+        chunks = _session(player).get(url, stream=True).iter_content(1000)
+        assert b''.join(chunks) == self.body
+
+    def test_unknown_request(self, tmpdir):
+        player = CassetteAdapter(str(tmpdir))
+        with pytest.raises(requests.ConnectionError):
+            _session(player).get('file:///no/such/recording')
+
+    def test_key_ignores_param_order_and_crumb(self, tmpdir):
+        adapter = CassetteAdapter(str(tmpdir))
+
+        def key(url):
+            return adapter.key(requests.Request('GET', url).prepare())
+
+        assert (key('http://a.b/c?x=1&y=2&crumb=abc') ==
+                key('http://a.b/c?y=2&x=1&crumb=xyz'))
+        assert key('http://a.b/c?x=1') != key('http://a.b/c?x=2')
+
+    def test_simulated_latency_and_bandwidth(self, tmpdir):
+        source = tmpdir.join('data.csv')
+        source.write_binary(self.body)
+        url = 'file://' + str(source)
+        cassette = str(tmpdir.join('cassette'))
+        recorder = CassetteAdapter(cassette, mode='once',
+                                   upstream=FileAdapter())
+        _session(recorder).get(url)
+
+        player = CassetteAdapter(cassette, latency=0.05,
+                                 bandwidth=len(self.body) / 0.1)
+        start = time.time()
+        response = _session(player).get(url)
+        assert time.time() - start >= 0.15
+        assert response.elapsed.total_seconds() >= 0.05
+
+    def test_invalid_mode(self, tmpdir):
+        with pytest.raises(ValueError):
+            CassetteAdapter(str(tmpdir), mode='rewind')
+
+    def test_mount_cassette(self, tmpdir):
+        session = mount_cassette(str(tmpdir))
+        assert isinstance(session.get_adapter('https://x'), CassetteAdapter)
+        assert isinstance(session.get_adapter('ftp://x'), CassetteAdapter)
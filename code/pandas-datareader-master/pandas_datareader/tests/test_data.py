@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 import pandas.util.testing as tm
@@ -15,6 +18,11 @@ class TestOptionsWarnings(object):
         with tm.assert_produces_warning():
             web.Options('aapl')
 
+    @pytest.mark.parametrize('data_source', ['yahoo', 'google'])
+    def test_options_compact(self, data_source):
+        assert web.Options('aapl', data_source, compact=True).compact
+        assert not web.Options('aapl', data_source).compact
+
 
 class TestDataReader(object):
 
@@ -39,3 +47,43 @@ class TestDataReader(object):
     def test_not_implemented(self):
         with pytest.raises(NotImplementedError):
             DataReader("NA", "NA")
+
+
+class TestLazyImports(object):
+
+    def _loaded_after(self, code):
+        code = ("import sys\n%s\n"
+                "print(' '.join(sorted(m for m in sys.modules "
+                "if m.startswith(('pandas_datareader', 'requests_')))))"
+                % code)
+        out = subprocess.check_output([sys.executable, '-c', code])
+        return set(out.decode().split())
+
+    def test_import_loads_no_readers(self):
+        loaded = self._loaded_after('import pandas_datareader')
+        assert 'pandas_datareader.data' in loaded
+        for module in ['pandas_datareader.edgar', 'pandas_datareader.fred',
+                       'pandas_datareader.yahoo.daily',
+                       'pandas_datareader.quandl']:
+            assert module not in loaded
+        assert 'requests_ftp' not in loaded
+
+    def test_attribute_access_loads_reader(self):
+        loaded = self._loaded_after('import pandas_datareader.data as web\n'
+                                    'web.FredReader')
+        assert 'pandas_datareader.fred' in loaded
+        assert 'pandas_datareader.edgar' not in loaded
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            web.NoSuchReader
+
+    def test_reader_is_cached(self):
+        from pandas_datareader.fred import FredReader
+        assert web.FredReader is FredReader
+        assert 'FredReader' in vars(web)
+
+    def test_from_import(self):
+        from pandas_datareader.data import EdgarIndexReader
+        from pandas_datareader.edgar import EdgarIndexReader as reader
+        assert EdgarIndexReader is reader
@@ -1,9 +1,12 @@
 import pytest
 
+import numpy as np
 import pandas as pd
 import pandas.util.testing as tm
 import pandas_datareader.data as web
 
+from pandas_datareader.edgar import EdgarIndexReader
+
 
 class TestEdgarIndex(object):
 
@@ -53,3 +56,40 @@ class TestEdgarIndex(object):
         exp_columns = pd.Index(['company_name', 'form_type',
                                 'filename'], dtype='object')
         tm.assert_index_equal(ed.columns, exp_columns)
+
+
+class _IndexFTP(object):
+
+    def __init__(self, lines):
+        self.lines = lines
+
+    def retrlines(self, cmd, callback):
+        for line in self.lines:
+            callback(line)
+
+
+class TestEdgarCompact(object):
+
+    lines = ['Description: Master Index of EDGAR Dissemination Feed',
+             'CIK|Company Name|Form Type|Date Filed|Filename',
+             '--------------------------------------------------------',
+             '1000045|NICHOLAS FINANCIAL INC|10-Q|20170103|edgar/data/1.txt',
+             '1000045|NICHOLAS FINANCIAL INC|8-K|20170103|edgar/data/2.txt',
+             '1000097|KINGDON CAPITAL|10-Q|20170104|edgar/data/3.txt']
+
+    def _read(self, compact):
+        reader = EdgarIndexReader('daily', compact=compact)
+        reader._sec_ftp_session = _IndexFTP(self.lines)
+        return reader._read_one_data('master.20170103.idx', None)
+
+    def test_compact_schema(self):
+        index = self._read(compact=True)
+        assert index['cik'].dtype == np.int32
+        for col in ['company_name', 'form_type', 'date_filed']:
+            assert index[col].dtype == 'category'
+
+        expected = self._read(compact=False)
+        assert list(index['cik']) == [int(cik) for cik in expected['cik']]
+        tm.assert_series_equal(index['filename'], expected['filename'])
+        for col in ['company_name', 'form_type', 'date_filed']:
+            assert list(index[col]) == list(expected[col])
@@ -1,9 +1,14 @@
+import gzip
+import io
 import os
 import pytest
 
-from requests.exceptions import HTTPError
+import pandas as pd
+from requests.exceptions import ConnectionError, HTTPError
 import pandas_datareader as pdr
 import pandas_datareader.data as web
+from pandas_datareader.compat import BytesIO
+from pandas_datareader.enigma import EnigmaReader, _GzipStream
 
 TEST_API_KEY = os.getenv('ENIGMA_API_KEY')
 
@@ -40,3 +45,42 @@ class TestEnigma(object):
         with pytest.raises(HTTPError):
             web.DataReader('enigma.inspections.restaurants.fllzzy',
                            'enigma', access_key=TEST_API_KEY)
+
+
+class TestGzipStream(object):
+
+    def test_read_csv_chunks(self):
+        csv = 'serialid,name\n' + ''.join('%d,name%d\n' % (i, i)
+                                          for i in range(1000))
+        buf = BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb') as gz:
+            gz.write(csv.encode('utf-8'))
+        data = buf.getvalue()
+        chunks = [data[i:i + 100] for i in range(0, len(data), 100)]
+
+        # pandas >= 0.20 only reads objects with read and __iter__
+        stream = _GzipStream(chunks)
+        assert hasattr(stream, 'read') and hasattr(stream, '__iter__')
+        df = pd.read_csv(stream, encoding='utf-8')
+        assert df.shape == (1000, 2)
+        assert df['name'].iloc[-1] == 'name999'
+
+        parts = list(pd.read_csv(io.BufferedReader(_GzipStream(chunks)),
+                                 encoding='utf-8', chunksize=300))
+        assert [len(p) for p in parts] == [300, 300, 300, 100]
+
+
+class TestPollExportUrl(object):
+
+    def test_connection_error_is_retried(self):
+        class _Session(object):
+            def head(self, url, **kwargs):
+                raise ConnectionError('reset')
+
+        reader = EnigmaReader(datapath='enigma.x', api_key='key')
+        reader.session = _Session()
+        reader._export = {'head_url': 'http://head',
+                          'export_url': 'http://export'}
+        assert reader.poll_export_url() is None
+        with pytest.raises(ConnectionError):
+            reader.extract_export_url(delay=0, max_attempts=1)
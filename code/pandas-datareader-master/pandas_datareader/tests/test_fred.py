@@ -9,6 +9,7 @@ import pandas_datareader.data as web
 
 from pandas import DataFrame
 from pandas_datareader._utils import RemoteDataError
+from pandas_datareader.fred import FredReader
 
 
 class TestFred(object):
@@ -81,3 +82,47 @@ class TestFred(object):
         names = ['NOTAREALSERIES', 'CPIAUCSL', "ALSO FAKE"]
         with pytest.raises(RemoteDataError):
             web.DataReader(names, data_source="fred")
+
+
+class _LocalFredReader(FredReader):
+    base_dir = None
+
+    @property
+    def url(self):
+        return 'file://' + self.base_dir + '/'
+
+
+class TestFredAssembly(object):
+
+    def _write(self, tmpdir, name, rows):
+        path = tmpdir.mkdir(name).mkdir('downloaddata').join(name + '.csv')
+        path.write('DATE,VALUE\n' + '\n'.join(rows) + '\n')
+
+    def test_outer_join(self, tmpdir):
+        self._write(tmpdir, 'A', ['2010-01-01,1.0', '2010-03-01,3.0',
+                                  '2010-04-01,.'])
+        self._write(tmpdir, 'B', ['2010-02-01,20.0', '2010-03-01,30.0'])
+        _LocalFredReader.base_dir = str(tmpdir)
+
+        df = _LocalFredReader(['A', 'B'], start='2010-01-01',
+                              end='2010-03-31').read()
+        expected = DataFrame({'A': [1.0, np.nan, 3.0],
+                              'B': [np.nan, 20.0, 30.0]},
+                             index=pd.to_datetime(['2010-01-01', '2010-02-01',
+                                                   '2010-03-01']))
+        expected.index.name = 'DATE'
+        tm.assert_frame_equal(df, expected)
+
+    def test_missing_date(self, tmpdir):
+        self._write(tmpdir, 'A', ['2010-01-01,1.0', ',2.0'])
+        self._write(tmpdir, 'B', ['2010-02-01,20.0'])
+        _LocalFredReader.base_dir = str(tmpdir)
+
+        # the row without a date is left out instead of failing the union
+        df = _LocalFredReader(['A', 'B'], start='2010-01-01',
+                              end='2010-03-31').read()
+        expected = DataFrame({'A': [1.0, np.nan], 'B': [np.nan, 20.0]},
+                             index=pd.to_datetime(['2010-01-01',
+                                                   '2010-02-01']))
+        expected.index.name = 'DATE'
+        tm.assert_frame_equal(df, expected)
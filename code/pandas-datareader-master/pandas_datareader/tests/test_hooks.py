@@ -0,0 +1,94 @@
+import datetime
+
+import numpy as np
+import pytest
+import requests
+
+from pandas_datareader.base import _BaseReader
+from pandas_datareader.hooks import (LatencyAggregator, Span, add_hook,
+                                     remove_hook)
+
+
+class _LocalReader(_BaseReader):
+
+    def __init__(self, path, **kwargs):
+        super(_LocalReader, self).__init__(symbols=[], **kwargs)
+        self.path = path
+
+    @property
+    def url(self):
+        return 'file://' + str(self.path)
+
+
+class TestLatencyAggregator(object):
+
+    def test_histogram_and_summary(self):
+        agg = LatencyAggregator(bounds=[0.01, 0.1, 1.])
+        for duration in [0.005, 0.05, 0.05, 0.5, 5.]:
+            agg(Span('FredReader', 'request', duration, nbytes=10))
+        agg(Span('FredReader', 'parse', 0.001))
+        hist = agg.histogram()
+        assert list(hist.loc[('FredReader', 'request')]) == [1, 2, 1, 1]
+        assert list(hist.loc[('FredReader', 'parse')]) == [1, 0, 0, 0]
+        summary = agg.summary().loc[('FredReader', 'request')]
+        assert summary['count'] == 5
+        assert summary['bytes'] == 50
+        assert summary['p50'] == 0.1
+        assert np.isinf(summary['p99'])
+        agg.reset()
+        assert len(agg.summary()) == 0
+        assert len(agg.histogram()) == 0
+
+
+class TestReaderHooks(object):
+
+    def test_spans_of_a_read(self, tmpdir):
+        path = tmpdir.join('data.csv')
+        path.write('Date,Value\n2017-01-02,1.0\n2017-01-03,2.0\n')
+        reader = _LocalReader(path)
+        spans = []
+        reader.hooks.append(spans.append)
+        df = reader.read()
+        assert len(df) == 2
+        phases = [span.phase for span in spans]
+        assert phases == ['request', 'transfer', 'decode', 'parse']
+        assert all(span.source == '_LocalReader' for span in spans)
+        assert all(span.duration >= 0 for span in spans)
+        assert spans[2].nbytes == len(path.read())
+
+    @pytest.mark.parametrize('length, nbytes',
+                             [(12, 12), ('12', 12), ('n/a', None)])
+    def test_content_length(self, length, nbytes):
+        # requests-file 1.x sets Content-Length to an int
+        class _Session(object):
+            def get(self, url, **kwargs):
+                response = requests.Response()
+                response.status_code = 200
+                response.headers['Content-Length'] = length
+                response.elapsed = datetime.timedelta(0)
+                return response
+
+        reader = _BaseReader([], session=_Session())
+        spans = []
+        reader.hooks.append(spans.append)
+        reader._send('http://x')
+        assert spans[1].phase == 'transfer'
+        assert spans[1].nbytes == nbytes
+
+    def test_retries_are_reported(self, tmpdir):
+        reader = _LocalReader(tmpdir.join('missing.csv'), retry_count=2,
+                              pause=0)
+        agg = add_hook(LatencyAggregator())
+        try:
+            with pytest.raises(IOError):
+                reader.read()
+        finally:
+            remove_hook(agg)
+        summary = agg.summary()
+        assert summary.loc[('_LocalReader', 'request'), 'count'] == 3
+        assert summary.loc[('_LocalReader', 'retry'), 'count'] == 3
+
+    def test_no_hooks(self, tmpdir):
+        path = tmpdir.join('data.csv')
+        path.write('Date,Value\n2017-01-02,1.0\n')
+        assert len(_LocalReader(path).read()) == 1
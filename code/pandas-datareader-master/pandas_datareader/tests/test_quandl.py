@@ -1,5 +1,9 @@
+import pandas as pd
+import pytest
+
 import pandas_datareader.data as web
-from pandas_datareader._utils import RemoteDataError
+from pandas_datareader._utils import RemoteDataError, SymbolWarning
+from pandas_datareader.quandl import QuandlReader, _normalize_column
 from pandas_datareader._testing import skip_on_exception
 
 
@@ -92,3 +96,45 @@ class TestQuandl(object):
                             'Ask', 'PEx', 'High', 'Low', 'PreviousClose',
                             'ShareVolume000', 'Turnover000', 'LotSize'])
         assert df.High.at[self.day2] == 91.9
+
+
+class TestQuandlOffline(object):
+
+    def test_normalize_column(self):
+        assert _normalize_column('Adj. Close') == 'AdjClose'
+        assert _normalize_column("Turnover (000's)") == 'Turnover000s'
+        assert _normalize_column('Ex-Dividend') == 'ExDividend'
+        assert _normalize_column('% Change') == 'Change'
+
+    def test_dataset_urls(self):
+        reader = QuandlReader(['F', 'FSE/ALV_X', 'ALV.DE'],
+                              start='2015-01-01', end='2015-01-05')
+        pairs = [reader._parse_symbol(s) for s in reader.symbols]
+        assert pairs == [('WIKI', 'F'), ('FSE', 'ALV_X'), ('SSE', 'ALV')]
+        url = reader._dataset_url('FSE', 'ALV_X')
+        assert url.startswith(QuandlReader._BASE_URL + 'FSE/ALV_X.csv?')
+        assert 'start_date=2015-01-01' in url
+        assert url == reader.url.replace('WIKI/F', 'FSE/ALV_X')
+
+    def test_failed_symbols_are_dropped(self, tmpdir):
+        tmpdir.join('WIKI_F.csv').write('Date,Close\n2015-01-02,15.36\n')
+
+        class _LocalReader(QuandlReader):
+            def _dataset_url(self, datasetname, symbol):
+                return 'file://%s/%s_%s.csv' % (tmpdir, datasetname, symbol)
+
+        symbols = pd.DataFrame(index=['F', 'GM', 'bad symbol'])
+        with pytest.warns(SymbolWarning) as record:
+            df = _LocalReader(symbols, start='2015-01-01',
+                              end='2015-01-05').read()
+        assert sorted(str(w.message) for w in record
+                      if w.category is SymbolWarning) == [
+            "Failed to read symbol: 'GM', dropping it.",
+            "Failed to read symbol: 'bad symbol', dropping it."]
+        assert list(df['Symbol']) == ['F']
+        assert list(df['Close']) == [15.36]
+
+        with pytest.raises(RemoteDataError):
+            with pytest.warns(SymbolWarning):
+                _LocalReader(['GM', 'GE'], start='2015-01-01',
+                             end='2015-01-05').read()
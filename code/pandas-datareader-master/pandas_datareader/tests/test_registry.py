@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_datareader.data import DataReader
+from pandas_datareader.registry import (DataSource, available_sources,
+                                        get_source, register_source,
+                                        unregister_source)
+
+
+class _EchoReader(object):
+
+    def __init__(self, symbols, **kwargs):
+        self.symbols = symbols
+        self.kwargs = kwargs
+
+    def read(self):
+        return self
+
+
+class _RangeReader(object):
+    """ returns one row per day from start to end """
+
+    starts = []
+
+    def __init__(self, symbols, start=None, end=None, **kwargs):
+        self.start, self.end = start, end
+
+    def read(self):
+        _RangeReader.starts.append(self.start)
+        index = pd.date_range(self.start or '2017-01-01', self.end)
+        return pd.DataFrame({'A': np.arange(len(index))}, index=index)
+
+
+class TestRegistry(object):
+
+    def setup_method(self, method):
+        self.source = register_source(
+            DataSource('echo', _EchoReader, multi_symbol=True, max_batch=10,
+                       rate_limit=4, max_workers=3, kwargs={'flag': True}))
+
+    def teardown_method(self, method):
+        unregister_source('echo')
+
+    def test_builtin_sources(self):
+        for name in ['yahoo', 'google', 'fred', 'famafrench', 'quandl',
+                     'enigma', 'nasdaq', 'edgar-index']:
+            assert name in available_sources()
+        assert get_source('fred').multi_symbol
+        assert not get_source('famafrench').multi_symbol
+        assert get_source('yahoo').max_batch == 25
+        for name in ['yahoo', 'quandl', 'fred']:
+            assert get_source(name).rate_limit is not None
+            assert get_source(name).max_workers is not None
+            assert get_source(name).incremental
+        assert not get_source('yahoo').cacheable
+        assert get_source('fred').cacheable
+
+    def test_reader_is_resolved_lazily(self):
+        source = DataSource('lazy', 'pandas_datareader.registry:DataSource')
+        assert source.reader is DataSource
+
+    def test_data_reader_uses_registered_source(self):
+        reader = DataReader(['A', 'B'], 'echo', pause=0.01)
+        assert isinstance(reader, _EchoReader)
+        assert reader.symbols == ['A', 'B']
+        assert reader.kwargs['chunksize'] == 10
+        assert reader.kwargs['flag']
+        # the pause is raised to honour the rate limit
+        assert reader.kwargs['pause'] == 0.25
+        assert reader._max_workers == 3
+
+    def test_single_symbol_source(self):
+        register_source(DataSource('single', _EchoReader), overwrite=True)
+        try:
+            assert DataReader('A', 'single').symbols == 'A'
+            with pytest.raises(ValueError):
+                DataReader(['A', 'B'], 'single')
+        finally:
+            unregister_source('single')
+
+    def test_data_attribute_resolved_through_registry(self):
+        import pandas_datareader.data as web
+        assert self.source.reader_name == '_EchoReader'
+        assert web._EchoReader is _EchoReader
+        with pytest.raises(AttributeError):
+            web._NoSuchReader
+
+    def test_cacheable(self):
+        assert self.source.create_reader('A')._cacheable
+        source = DataSource('nocache', _EchoReader, cacheable=False)
+        assert not source.create_reader('A')._cacheable
+
+    @pytest.mark.parametrize('incremental, start', [
+        (True, pd.Timestamp('2017-01-11')),
+        (False, pd.Timestamp('2017-01-01'))])
+    def test_update(self, incremental, start):
+        source = DataSource('range', _RangeReader, incremental=incremental)
+        data = source.read('A', start='2017-01-01', end='2017-01-10')
+        _RangeReader.starts = []
+        data = source.update('A', data, end='2017-01-20')
+        assert _RangeReader.starts == [start]
+        assert len(data) == 20
+        assert data.index.is_unique
+        # nothing to read once the data is up to date
+        if incremental:
+            assert source.update('A', data, end='2017-01-20') is data
+            assert len(_RangeReader.starts) == 1
+
+    def test_duplicate_registration(self):
+        with pytest.raises(ValueError):
+            register_source(DataSource('echo', _EchoReader))
+        other = DataSource('echo', _EchoReader)
+        register_source(other, overwrite=True)
+        assert get_source('echo') is other
+
+    def test_invalid_capabilities(self):
+        with pytest.raises(ValueError):
+            DataSource('bad', _EchoReader, max_batch=0)
+        with pytest.raises(ValueError):
+            DataSource('bad', _EchoReader, rate_limit=-1)
+        with pytest.raises(TypeError):
+            register_source('bad')
+
+    def test_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            get_source('NA')
+
+    def test_nasdaq_name_check(self):
+        with pytest.raises(ValueError):
+            DataReader('AAPL', 'nasdaq')
@@ -0,0 +1,82 @@
+import datetime as dt
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+import pytest
+
+from pandas_datareader.store import from_store, store_metadata, to_store
+
+
+class TestStore(object):
+
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("pyarrow", minversion="1.0.0")
+
+    def setup_method(self, method):
+        dates = pd.date_range('2017-01-02', periods=5, name='Date')
+        bars = []
+        for symbol in ['AAPL', 'MSFT']:
+            df = pd.DataFrame({'Close': np.arange(5.), 'Volume': np.arange(5)},
+                              index=dates)
+            df.insert(0, 'Symbol', symbol)
+            bars.append(df)
+        self.bars = pd.concat(bars)
+        self.params = {'symbols': ['AAPL', 'MSFT'],
+                       'start': dt.datetime(2017, 1, 2)}
+
+    @pytest.mark.parametrize('name', ['bars.arrow', 'bars.parquet'])
+    def test_round_trip(self, tmpdir, name):
+        path = str(tmpdir.join(name))
+        to_store(self.bars, path, source='yahoo', params=self.params)
+        tm.assert_frame_equal(from_store(path), self.bars)
+
+        meta = store_metadata(path)
+        assert meta['source'] == 'yahoo'
+        assert meta['params']['symbols'] == ['AAPL', 'MSFT']
+        assert meta['params']['start'] == '2017-01-02T00:00:00'
+        assert 'fetched' in meta
+
+    def test_columns_keep_index(self, tmpdir):
+        path = str(tmpdir.join('bars.arrow'))
+        to_store(self.bars, path)
+        df = from_store(path, columns=['Close'])
+        tm.assert_frame_equal(df, self.bars[['Close']])
+
+    def test_multi_index(self, tmpdir):
+        chain = self.bars.set_index('Symbol', append=True)
+        path = str(tmpdir.join('chain.arrow'))
+        to_store(chain, path, source='yahoo-options')
+        tm.assert_frame_equal(from_store(path, memory_map=False), chain)
+
+    def test_partitioned(self, tmpdir):
+        path = str(tmpdir.join('bars'))
+        to_store(self.bars, path, source='yahoo', partition_on=['Symbol'])
+        assert sorted(p.basename for p in tmpdir.join('bars').listdir()) == [
+            'Symbol=AAPL', 'Symbol=MSFT', '_metadata']
+        df = from_store(path, filters=[('Symbol', '=', 'MSFT')])
+        assert len(df) == 5
+        assert (df['Symbol'] == 'MSFT').all()
+        assert store_metadata(path)['source'] == 'yahoo'
+
+    def test_invalid_options(self, tmpdir):
+        with pytest.raises(ValueError):
+            to_store(self.bars, str(tmpdir.join('bars.arrow')),
+                     partition_on=['Symbol'])
+        path = str(tmpdir.join('plain.parquet'))
+        self.bars.to_parquet(path)
+        with pytest.raises(ValueError):
+            store_metadata(path)
+
+
+class TestPyarrowVersion(object):
+
+    def test_old_pyarrow(self, monkeypatch):
+        pyarrow = types.ModuleType('pyarrow')
+        pyarrow.__version__ = '0.17.1'
+        monkeypatch.setitem(sys.modules, 'pyarrow', pyarrow)
+        with pytest.raises(ImportError, match='pyarrow >= 1.0.0'):
+            to_store(pd.DataFrame({'a': [1]}), 'x.parquet')
@@ -214,3 +214,23 @@ class TestWB(object):
             # assert_index_equal doesn't exists
             assert result.columns.equals(exp_col)
             assert len(result) > 10000
+
+
+class TestWBCompact(object):
+
+    def test_read_lines_compact(self):
+        out = [{'page': 1, 'total': 3},
+               [{'country': {'value': 'Canada', 'id': 'CA'},
+                 'date': '2016', 'value': '1529760492201.5'},
+                {'country': {'value': 'Canada', 'id': 'CA'},
+                 'date': '2015', 'value': None},
+                {'country': {'value': 'Mexico', 'id': 'MX'},
+                 'date': '2016', 'value': 1046922702960}]]
+        reader = WorldBankReader('NY.GDP.MKTP.CD', countries=['CA', 'MX'],
+                                 compact=True)
+        df = reader._read_lines(out)
+        assert df[3].dtype == np.float32
+        assert np.isnan(df[3].iloc[1])
+        assert list(df[0]) == ['Canada', 'Canada', 'Mexico']
+        assert df[2].dtype == np.int32
+        assert list(df[2]) == [2016, 2015, 2016]
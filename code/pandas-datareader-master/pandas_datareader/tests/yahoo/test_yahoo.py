@@ -1,4 +1,5 @@
 from datetime import datetime
+import threading
 import requests
 
 import numpy as np
@@ -10,6 +11,9 @@ import pandas.util.testing as tm
 
 import pandas_datareader.data as web
 from pandas_datareader.data import YahooDailyReader
+from pandas_datareader.yahoo.actions import _parse_split_ratios
+from pandas_datareader.yahoo.daily import (_CrumbCache, _adjust_prices,
+                                           _calc_return_index)
 from pandas_datareader.yahoo.quotes import _yahoo_codes
 from pandas_datareader._utils import RemoteDataError
 from pandas_datareader._testing import skip_on_exception
@@ -245,3 +249,96 @@ class TestYahoo(object):
 
         result = web.DataReader(['AAPL', 'F'], 'yahoo-actions', start, end)
         assert isinstance(result, pd.Panel)
+
+
+class TestCrumbCache(object):
+
+    def test_single_flight(self):
+        cache = _CrumbCache()
+        calls = []
+        barrier = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            barrier.wait(1)
+            return 'crumb', {}
+
+        threads = [threading.Thread(target=cache.get, args=(fetch,))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        barrier.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert cache.get(fetch) == ('crumb', {})
+        assert len(calls) == 1
+
+    def test_expiry_and_invalidate(self):
+        cache = _CrumbCache(expire_after=0)
+        crumbs = iter(['a', 'b', 'c', 'd'])
+
+        def fetch():
+            return next(crumbs), {}
+
+        assert cache.get(fetch)[0] == 'a'
+        # expired immediately
+        assert cache.get(fetch)[0] == 'b'
+
+        cache.expire_after = 3600
+        assert cache.get(fetch)[0] == 'c'
+        # a stale crumb that is no longer cached does not drop the new one
+        cache.invalidate('b')
+        assert cache.get(fetch)[0] == 'c'
+        cache.invalidate('c')
+        assert cache.get(fetch)[0] == 'd'
+
+
+class TestSplitRatios(object):
+
+    def test_parse_split_ratios(self):
+        result = _parse_split_ratios(pd.Series(['2/1', '3/2', '7', '1/10']))
+        expected = np.array([0.5, 2. / 3, 1. / 7, 10.])
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_parse_split_ratios_empty(self):
+        result = _parse_split_ratios(pd.Series([], dtype=object))
+        assert len(result) == 0
+
+
+class TestPriceAdjustment(object):
+
+    def setup_method(self, method):
+        idx = pd.date_range('2017-01-02', periods=4)
+        self.prices = DataFrame({'A': [1., 2., np.nan, 4.],
+                                 'B': [np.nan, 10., 11., 12.]}, index=idx)
+
+    def test_calc_return_index_late_listing(self):
+        result = _calc_return_index(self.prices)
+        expected = DataFrame({'A': [1., 2., 2., 4.],
+                              'B': [np.nan, 1., 1.1, 1.2]},
+                             index=self.prices.index)
+        tm.assert_frame_equal(result, expected)
+
+    def test_calc_return_index_long_format(self):
+        long = pd.concat([self.prices['A'], self.prices['B']])
+        symbols = ['A'] * 4 + ['B'] * 4
+        result = _calc_return_index(long, symbols=symbols)
+        expected = pd.concat([_calc_return_index(self.prices['A']),
+                              _calc_return_index(self.prices['B'])])
+        tm.assert_numpy_array_equal(result.values, expected.values)
+
+    def test_adjust_prices(self):
+        df = DataFrame({'Open': [2., 4.], 'High': [2., 4.], 'Low': [2., 4.],
+                        'Close': [2., 4.], 'Adj Close': [1., 3.]})
+        result = _adjust_prices(df, dtype=np.float32)
+        assert 'Adj Close' in df.columns
+        assert 'Adj Close' not in result.columns
+        assert result['Open'].dtype == np.float32
+        tm.assert_numpy_array_equal(result['Close'].values,
+                                    np.array([1., 3.], dtype=np.float32))
+
+        result = _adjust_prices(df, inplace=True)
+        assert result is df
+        tm.assert_numpy_array_equal(df['Adj_Ratio'].values,
+                                    np.array([0.5, 0.75]))
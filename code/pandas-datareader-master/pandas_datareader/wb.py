@@ -106,6 +106,9 @@ class WorldBankReader(_BaseReader):
 
         errors='raise', will raise a ValueError on a bad country code.
 
+    compact: bool, default False
+        Parse indicator values as float32 instead of float64.
+
     Returns
     -------
 
@@ -117,7 +120,8 @@ class WorldBankReader(_BaseReader):
 
     def __init__(self, symbols=None, countries=None,
                  start=None, end=None,
-                 retry_count=3, pause=0.001, session=None, errors='warn'):
+                 retry_count=3, pause=0.001, session=None, errors='warn',
+                 compact=False):
 
         if symbols is None:
             symbols = ['NY.GDP.MKTP.CD', 'NY.GNS.ICTR.ZS']
@@ -127,7 +131,8 @@ class WorldBankReader(_BaseReader):
         super(WorldBankReader, self).__init__(symbols=symbols,
                                               start=start, end=end,
                                               retry_count=retry_count,
-                                              pause=pause, session=session)
+                                              pause=pause, session=session,
+                                              compact=compact)
 
         if countries is None:
             countries = ['MX', 'CA', 'US']
@@ -185,7 +190,8 @@ class WorldBankReader(_BaseReader):
             out = reduce(lambda x, y: x.merge(y, how='outer'), data)
             out = out.drop('iso_code', axis=1)
             out = out.set_index(['country', 'year'])
-            out = out.apply(pd.to_numeric, errors='ignore')
+            if not self.compact:
+                out = out.apply(pd.to_numeric, errors='ignore')
 
             return out
         else:
@@ -222,6 +228,16 @@ class WorldBankReader(_BaseReader):
         iso_code = [x['country']['id'] for x in data]
         year = [x['date'] for x in data]
         value = [x['value'] for x in data]
+        if self.compact:
+            # values go straight to float32 instead of via object; years
+            # become int32 unless the dates are periods such as '2016Q1'
+            try:
+                year = np.array(year, dtype='int32')
+            except ValueError:
+                pass
+            return pd.DataFrame({0: country, 1: iso_code, 2: year,
+                                 3: np.array(value, dtype='float32')},
+                                columns=[0, 1, 2, 3])
         # Prepare output
         df = pd.DataFrame([country, iso_code, year, value]).T
         return df
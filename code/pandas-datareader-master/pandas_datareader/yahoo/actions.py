@@ -1,5 +1,12 @@
-from pandas import (concat, DataFrame)
+import warnings
+
+import numpy as np
+import pandas.compat as compat
+from pandas import (concat, DataFrame, Series)
+from pandas_datareader.base import _DailyBaseReader
 from pandas_datareader.yahoo.daily import YahooDailyReader
+from pandas_datareader._utils import (RemoteDataError, SymbolWarning,
+                                      _map_concurrent)
 
 
 class YahooActionReader(YahooDailyReader):
@@ -7,36 +14,125 @@ class YahooActionReader(YahooDailyReader):
     Returns DataFrame of historical corporate actions (dividends and stock
     splits) from symbols, over date range, start to end. All dates in the
     resulting DataFrame correspond with dividend and stock split ex-dates.
+
+    The dividend and split histories are downloaded concurrently.
+    ``read_batch`` downloads the actions of many symbols into a single
+    long-format DataFrame.
     """
+
+    # Number of downloads in flight at once in read_batch
+    _max_workers = 8
+
     def read(self):
-        dividends = YahooDivReader(symbols=self.symbols,
-                                   start=self.start,
-                                   end=self.end,
-                                   retry_count=self.retry_count,
-                                   pause=self.pause,
-                                   session=self.session).read()
-        # Add a label column so we can combine our two DFs
-        if isinstance(dividends, DataFrame):
-            dividends["action"] = "DIVIDEND"
-            dividends = dividends.rename(columns={'Dividends': 'value'})
-
-        splits = YahooSplitReader(symbols=self.symbols,
-                                  start=self.start,
-                                  end=self.end,
-                                  retry_count=self.retry_count,
-                                  pause=self.pause,
-                                  session=self.session).read()
-        # Add a label column so we can combine our two DFs
-        if isinstance(splits, DataFrame):
-            splits["action"] = "SPLIT"
-            splits = splits.rename(columns={'Stock Splits': 'value'})
-            # Converts fractional form splits (i.e. "2/1") into conversion
-            # ratios, then take the reciprocal
-            splits['value'] = splits.apply(lambda x: 1/eval(x['value']), axis=1)  # noqa
-
-        output = concat([dividends, splits]).sort_index(ascending=False)
-
-        return output
+        try:
+            dividends, splits = _map_concurrent(
+                lambda klass: self._read_action(klass, self.symbols),
+                (YahooDivReader, YahooSplitReader), max_workers=2)
+            return _combine_actions(dividends, splits)
+        finally:
+            self.close()
+
+    def read_batch(self, symbols=None):
+        """
+        Read the corporate actions of many symbols concurrently.
+
+        Parameters
+        ----------
+        symbols : array-like object or DataFrame, optional
+            Symbols to read, defaults to the symbols of the reader.
+
+        Returns
+        -------
+        actions : DataFrame
+            Long-format table with columns 'Symbol', 'action' and 'value',
+            indexed by ex-date. Rows are ordered by symbol and, within a
+            symbol, by descending date as in ``read``. Symbols that fail to
+            download are skipped with a ``SymbolWarning``.
+        """
+        if symbols is None:
+            symbols = self.symbols
+        if isinstance(symbols, compat.string_types):
+            symbols = [symbols]
+        elif isinstance(symbols, DataFrame):
+            symbols = symbols.index
+        symbols = list(symbols)
+
+        def fetch(task):
+            sym, klass = task
+            try:
+                return self._read_action(klass, sym)
+            except IOError:
+                return None
+
+        tasks = [(sym, klass) for sym in symbols
+                 for klass in (YahooDivReader, YahooSplitReader)]
+        try:
+            results = _map_concurrent(fetch, tasks, self._max_workers)
+        finally:
+            self.close()
+
+        frames = []
+        for i, sym in enumerate(symbols):
+            dividends, splits = results[2 * i], results[2 * i + 1]
+            if dividends is None and splits is None:
+                msg = 'Failed to read symbol: {0!r}, skipping.'
+                warnings.warn(msg.format(sym), SymbolWarning)
+                continue
+            actions = _combine_actions(dividends, splits)
+            actions.insert(0, 'Symbol', sym)
+            frames.append(actions)
+
+        if len(frames) == 0:
+            msg = "No data fetched using {0!r}"
+            raise RemoteDataError(msg.format(self.__class__.__name__))
+        return concat(frames)
+
+    def _read_action(self, klass, symbols):
+        reader = klass(symbols=symbols,
+                       start=self.start,
+                       end=self.end,
+                       retry_count=self.retry_count,
+                       pause=self.pause,
+                       session=self.session)
+        # _DailyBaseReader.read leaves the shared session open
+        return _DailyBaseReader.read(reader)
+
+
+def _combine_actions(dividends, splits):
+    """
+    Label dividends and splits and stack them into one DataFrame, most
+    recent first.
+    """
+    # Add a label column so we can combine our two DFs
+    if isinstance(dividends, DataFrame):
+        dividends["action"] = "DIVIDEND"
+        dividends = dividends.rename(columns={'Dividends': 'value'})
+
+    # Add a label column so we can combine our two DFs
+    if isinstance(splits, DataFrame):
+        splits["action"] = "SPLIT"
+        splits = splits.rename(columns={'Stock Splits': 'value'})
+        splits['value'] = _parse_split_ratios(splits['value'])
+
+    return concat([dividends, splits]).sort_index(ascending=False)
+
+
+def _parse_split_ratios(values):
+    """
+    Convert fractional form splits (i.e. "2/1") into conversion ratios, then
+    take the reciprocal. A value without a denominator is read as "n/1".
+    """
+    values = Series(values)
+    if len(values) == 0:
+        return np.array([], dtype=np.float64)
+    parts = values.astype(str).str.split('/', expand=True)
+    numerator = np.asarray(parts[0], dtype=np.float64)
+    if parts.shape[1] > 1:
+        denominator = np.asarray(parts[1], dtype=np.float64)
+        denominator = np.where(np.isnan(denominator), 1, denominator)
+    else:
+        denominator = np.ones(len(parts))
+    return denominator / numerator
 
 
 class YahooDivReader(YahooDailyReader):
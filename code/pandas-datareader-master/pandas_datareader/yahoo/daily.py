@@ -1,11 +1,58 @@
 import re
+import threading
 import time
 import warnings
 import numpy as np
-from pandas import Panel
+from pandas import Panel, DataFrame, Series
 from pandas_datareader.base import (_DailyBaseReader, _in_chunks)
 from pandas_datareader._utils import (RemoteDataError, SymbolWarning)
 
+# Seconds a scraped crumb (and the cookies it is bound to) stays valid
+_CRUMB_EXPIRE_AFTER = 60 * 60
+
+
+class _CrumbCache(object):
+    """
+    Process-wide, thread-safe cache of the Yahoo! crumb and the cookies it is
+    bound to.
+
+    A miss is refreshed while holding the lock, so concurrent readers wait
+    for a single scrape instead of each downloading the history page.
+    """
+
+    def __init__(self, expire_after=_CRUMB_EXPIRE_AFTER):
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._crumb = None
+        self._cookies = None
+        self._expires = 0
+
+    def get(self, fetch):
+        """
+        Return a (crumb, cookies) tuple, calling ``fetch`` to scrape a new
+        one if nothing valid is cached.
+        """
+        with self._lock:
+            if self._crumb is None or time.time() >= self._expires:
+                self._crumb, self._cookies = fetch()
+                self._expires = time.time() + self.expire_after
+            return self._crumb, self._cookies
+
+    def invalidate(self, crumb=None):
+        """
+        Drop the cached crumb. If ``crumb`` is given, only drop it if it is
+        still the cached one, so a rejected crumb that has already been
+        replaced by another thread does not trigger a second scrape.
+        """
+        with self._lock:
+            if crumb is None or crumb == self._crumb:
+                self._crumb = None
+                self._cookies = None
+                self._expires = 0
+
+
+_crumb_cache = _CrumbCache()
+
 
 class YahooDailyReader(_DailyBaseReader):
 
@@ -44,6 +91,12 @@ class YahooDailyReader(_DailyBaseReader):
         'm' for monthly and 'v' for dividend.
     """
 
+    # Volume is inferred: it is int64 unless a row has 'null' in it
+    _schema = {'date_format': '%Y-%m-%d',
+               'dtype': {'Open': 'float64', 'High': 'float64',
+                         'Low': 'float64', 'Close': 'float64',
+                         'Adj Close': 'float64'}}
+
     def __init__(self, symbols=None, start=None, end=None, retry_count=3,
                  pause=0.35, session=None, adjust_price=False,
                  ret_index=False, chunksize=25, interval='d'):
@@ -116,7 +169,7 @@ class YahooDailyReader(_DailyBaseReader):
             if self.ret_index:
                 df['Ret_Index'] = _calc_return_index(df['Adj Close'])
             if self.adjust_price:
-                df = _adjust_prices(df)
+                df = _adjust_prices(df, inplace=True)
             return df.sort_index()
         finally:
             self.close()
@@ -151,7 +204,16 @@ class YahooDailyReader(_DailyBaseReader):
             msg = "No data fetched using {0!r}"
             raise RemoteDataError(msg.format(self.__class__.__name__))
 
-    def _get_crumb(self, retries):
+    def _get_crumb(self, retries, stale=None):
+        # A crumb that was rejected by the server is dropped before asking
+        # the cache, which then scrapes a new one exactly once.
+        if stale is not None:
+            _crumb_cache.invalidate(stale)
+        crumb, cookies = _crumb_cache.get(self._scrape_crumb)
+        self.session.cookies.update(cookies)
+        return crumb
+
+    def _scrape_crumb(self):
         # Scrape a history page for a valid crumb ID:
         tu = "https://finance.yahoo.com/quote/{}/history".format(self.symbols)
         response = self._get_response(tu,
@@ -161,42 +223,86 @@ class YahooDailyReader(_DailyBaseReader):
         rpat = '"CrumbStore":{"crumb":"([^"]+)"}'
 
         crumb = re.findall(rpat, out)[0]
-        return crumb.encode('ascii').decode('unicode-escape')
+        crumb = crumb.encode('ascii').decode('unicode-escape')
+        return crumb, self.session.cookies.copy()
 
 
-def _adjust_prices(hist_data, price_list=None):
+def _adjust_prices(hist_data, price_list=None, inplace=False, dtype=None):
     """
     Return modifed DataFrame or Panel with adjusted prices based on
     'Adj Close' price. Adds 'Adj_Ratio' column.
+
+    The ratio is computed row by row, so long-format data holding many
+    symbols is adjusted in the same single pass.
+
+    Parameters
+    ----------
+    hist_data : DataFrame or Panel
+        Data with 'Close', 'Adj Close' and the columns in price_list.
+    price_list : sequence of str, optional
+        Columns to adjust, defaults to 'Open', 'High', 'Low', 'Close'.
+    inplace : bool, default False
+        Modify hist_data instead of adjusting a copy.
+    dtype : numpy dtype, default numpy.float64
+        dtype of the adjusted prices and 'Adj_Ratio', e.g. numpy.float32.
     """
     if price_list is None:
         price_list = 'Open', 'High', 'Low', 'Close'
-    adj_ratio = hist_data['Adj Close'] / hist_data['Close']
+    if dtype is None:
+        dtype = np.float64
+    with np.errstate(divide='ignore', invalid='ignore'):
+        adj_ratio = (np.asarray(hist_data['Adj Close'], dtype=dtype) /
+                     np.asarray(hist_data['Close'], dtype=dtype))
 
-    data = hist_data.copy()
+    data = hist_data if inplace else hist_data.copy()
     for item in price_list:
-        data[item] = hist_data[item] * adj_ratio
+        data[item] = np.asarray(hist_data[item], dtype=dtype) * adj_ratio
     data['Adj_Ratio'] = adj_ratio
     del data['Adj Close']
     return data
 
 
-def _calc_return_index(price_df):
+def _calc_return_index(price_df, symbols=None, dtype=None):
     """
-    Return a returns index from a input price df or series. Initial value
-    (typically NaN) is set to 1.
+    Return a returns index from a input price df or series. The index is 1 at
+    the first valid price of each symbol, so symbols listed after the start
+    date begin later, and carries the last price forward over missing ones.
+
+    Parameters
+    ----------
+    price_df : DataFrame or Series
+        Wide prices (one column per symbol) or, with ``symbols``, a long
+        Series of prices in date order within each symbol.
+    symbols : array-like, optional
+        Symbol of each row of a long-format ``price_df``.
+    dtype : numpy dtype, default numpy.float64
+        dtype of the returned index, e.g. numpy.float32.
     """
-    df = price_df.pct_change().add(1).cumprod()
-    mask = df.iloc[1].notnull() & df.iloc[0].isnull()
-    df.loc[df.index[0], mask] = 1
-
-    # Check for first stock listings after starting date of index in ret_index
-    # If True, find first_valid_index and set previous entry to 1.
-    if (~mask).any():
-        for sym in mask.index[~mask]:
-            sym_idx = df.columns.get_loc(sym)
-            tstamp = df[sym].first_valid_index()
-            t_idx = df.index.get_loc(tstamp) - 1
-            df.iloc[t_idx, sym_idx] = 1
-
-    return df
+    if dtype is None:
+        dtype = np.float64
+    values = np.asarray(price_df, dtype=dtype)
+
+    if symbols is not None:
+        grouped = Series(values).groupby(np.asarray(symbols))
+        filled = np.asarray(grouped.ffill(), dtype=dtype)
+        first = np.asarray(grouped.transform('first'), dtype=dtype)
+        return Series(filled / first, index=price_df.index,
+                      name=getattr(price_df, 'name', None))
+
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, np.newaxis]
+    valid = ~np.isnan(values)
+    rows = np.arange(len(values))[:, np.newaxis]
+    cols = np.arange(values.shape[1])
+    # row of the last valid price at or before each row, -1 before listing
+    last = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    first = valid.argmax(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ret = values[np.maximum(last, 0), cols] / values[first, cols]
+    ret[last < 0] = np.nan
+
+    if squeeze:
+        return Series(ret[:, 0], index=price_df.index,
+                      name=getattr(price_df, 'name', None))
+    return DataFrame(ret, index=price_df.index, columns=price_df.columns)
@@ -0,0 +1,107 @@
+#
+# Python Module with Class
+# for Caching Technical Indicators
+# across Backtests
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+def _sma(values, window):
+    return pd.Series(values).rolling(window).mean().values
+
+
+def _std(values, window):
+    return pd.Series(values).rolling(window).std().values
+
+
+def _momentum(values, window):
+    return np.sign(_sma(values, window))
+
+
+class IndicatorCache(object):
+    ''' Class for memoizing rolling indicators of time series, so that
+    parameter sweeps and repeated backtests compute every indicator once.
+
+    Series are identified by their values; the results are returned with
+    the index of the series asked for.
+
+    Attributes
+    ==========
+    max_bytes: int
+        memory budget for the cached indicators; the least recently
+        used ones are evicted beyond it
+
+    Methods
+    =======
+    sma:
+        returns the simple moving average (rolling mean)
+    std:
+        returns the rolling standard deviation
+    momentum:
+        returns the sign of the rolling mean
+    get:
+        returns any of the indicators above by name
+    clear:
+        empties the cache
+    '''
+    indicators = {'sma': _sma, 'std': _std, 'momentum': _momentum}
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def get(self, series, indicator, window):
+        ''' Returns indicator ('sma', 'std' or 'momentum') with window
+        for series.
+        '''
+        values = np.ascontiguousarray(series.values, dtype=float)
+        key = (hashlib.sha1(values.view(np.uint8)).hexdigest(), len(values),
+               indicator, window)
+        result = self._cache.get(key)
+        if result is None:
+            self.misses += 1
+            result = self.indicators[indicator](values, window)
+            result.flags.writeable = False
+            self._cache[key] = result
+            self.nbytes += result.nbytes
+            while self.nbytes > self.max_bytes and len(self._cache) > 1:
+                self.nbytes -= self._cache.popitem(last=False)[1].nbytes
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        return pd.Series(result, index=series.index)
+
+    def sma(self, series, window):
+        ''' Returns the simple moving average of series.
+        '''
+        return self.get(series, 'sma', window)
+
+    def std(self, series, window):
+        ''' Returns the rolling standard deviation of series.
+        '''
+        return self.get(series, 'std', window)
+
+    def momentum(self, series, window):
+        ''' Returns the sign of the rolling mean of series.
+        '''
+        return self.get(series, 'momentum', window)
+
+    def clear(self):
+        ''' Empties the cache.
+        '''
+        self._cache.clear()
+        self.nbytes = 0
+
+
+# cache shared by all backtesters of a process
+cache = IndicatorCache()
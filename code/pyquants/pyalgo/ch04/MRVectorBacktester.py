@@ -41,7 +41,7 @@ class MRVectorBacktester(MomVectorBacktester):
         ''' Backtests the trading strategy.
         '''
         data = self.data.copy()
-        data['sma'] = data['price'].rolling(SMA).mean()
+        data['sma'] = cache.sma(data['price'], SMA)
         data['distance'] = data['price'] - data['sma']
         # sell signals
         data['position'] = np.where(data['distance'] > threshold, -1, np.nan)
@@ -10,7 +10,8 @@
 import numpy as np
 import pandas as pd
 from pandas_datareader import data as web
-import quandl as q
+from wiki_mirror import get_prices
+from IndicatorCache import cache
 
 class MomVectorBacktester(object):
     ''' Class for the vectorized backtesting of
@@ -56,7 +57,7 @@ class MomVectorBacktester(object):
         raw = web.DataReader(self.symbol, data_source='google',
                              start=self.start, end=self.end)['Close']
         '''
-        raw = q.get('WIKI/'+self.symbol, start_date=self.start, end_date=self.end, api_key=self.quandl_api_key)['Adj. Close']
+        raw = get_prices(self.symbol, self.start, self.end, self.quandl_api_key)
         raw = pd.DataFrame(raw)
         raw.rename(columns={'Adj. Close': 'price'}, inplace=True)
         raw['return'] = np.log(raw / raw.shift(1))
@@ -67,7 +68,7 @@ class MomVectorBacktester(object):
         '''
         self.momentum = momentum
         data = self.data.copy()
-        data['position'] = np.sign(data['return'].rolling(momentum).mean())
+        data['position'] = cache.momentum(data['return'], momentum)
         data['strategy'] = data['position'].shift(1) * data['return']
         # determine when a trade takes place
         trades = data['position'].diff().fillna(0) != 0
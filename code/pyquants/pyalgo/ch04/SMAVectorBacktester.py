@@ -10,8 +10,8 @@
 import numpy as np
 import pandas as pd
 from pandas_datareader import data as web
-from scipy.optimize import brute
-import quandl as q
+from wiki_mirror import get_prices
+from IndicatorCache import cache
 
 class SMAVectorBacktester(object):
     ''' Class for the vectorized backtesting of SMA-based trading strategies.
@@ -41,6 +41,8 @@ class SMAVectorBacktester(object):
         plots the performance of the strategy compared to the symbol
     update_and_run:
         updates SMA parameters and returns the (negative) absolute performance
+    grid_performance:
+        evaluates all combinations of SMA parameters in one vectorized pass
     optimize_parameters:
         implements a brute force optimizeation for the two SMA parameters
     '''
@@ -62,12 +64,12 @@ class SMAVectorBacktester(object):
         raw = web.DataReader(self.symbol, data_source='google',
                              start=self.start, end=self.end)['Close']
         '''
-        raw = q.get('WIKI/'+self.symbol, start_date=self.start, end_date=self.end, api_key=self.quandl_api_key)['Adj. Close']
+        raw = get_prices(self.symbol, self.start, self.end, self.quandl_api_key)
         raw = pd.DataFrame(raw)
         raw.rename(columns={'Adj. Close': 'price'}, inplace=True)
         raw['return'] = np.log(raw / raw.shift(1))
-        raw['SMA1'] = raw['price'].rolling(self.SMA1).mean()
-        raw['SMA2'] = raw['price'].rolling(self.SMA2).mean()
+        raw['SMA1'] = cache.sma(raw['price'], self.SMA1)
+        raw['SMA2'] = cache.sma(raw['price'], self.SMA2)
         self.data = raw
 
     def set_parameters(self, SMA1=None, SMA2=None):
@@ -75,10 +77,10 @@ class SMAVectorBacktester(object):
         '''
         if SMA1 is not None:
             self.SMA1 = SMA1
-            self.data['SMA1'] = self.data['price'].rolling(self.SMA1).mean()
+            self.data['SMA1'] = cache.sma(self.data['price'], self.SMA1)
         if SMA2 is not None:
             self.SMA2 = SMA2
-            self.data['SMA2'] = self.data['price'].rolling(self.SMA2).mean()
+            self.data['SMA2'] = cache.sma(self.data['price'], self.SMA2)
 
     def run_strategy(self):
         ''' Backtests the trading strategy.
@@ -116,6 +118,57 @@ class SMAVectorBacktester(object):
         self.set_parameters(int(SMA[0]), int(SMA[1]))
         return -self.run_strategy()[0]
 
+    def grid_performance(self, SMA1_range, SMA2_range):
+        ''' Returns the performance for all combinations of SMA parameters,
+        computed with NumPy for the whole grid instead of one backtest
+        per combination.
+
+        Parameters
+        ==========
+        SMA1_range, SMA2_range: tuple
+            tuples of the form (start, end, step size)
+
+        Returns
+        =======
+        results: pd.DataFrame
+            absolute (aperf) and out-/underperformance (operf) of the
+            strategy per (SMA1, SMA2) pair; .unstack() gives the surface
+        '''
+        SMA1 = np.arange(*SMA1_range).astype(int)
+        SMA2 = np.arange(*SMA2_range).astype(int)
+        price = self.data['price'].values
+        rets = np.nan_to_num(self.data['return'].values)
+        n = len(price)
+        # every SMA needed from one cumulative sum (NaN before the window)
+        windows = np.union1d(SMA1, SMA2)
+        csum = np.concatenate(([0.], np.cumsum(price)))
+        smas = np.full((len(windows), n), np.nan)
+        for k, w in enumerate(windows):
+            smas[k, w - 1:] = (csum[w:] - csum[:-w]) / w
+        sma1 = smas[np.searchsorted(windows, SMA1)]
+        sma2 = smas[np.searchsorted(windows, SMA2)]
+        # rsum[t]: sum of the log returns from day t on
+        rsum = np.concatenate((np.cumsum(rets[::-1])[::-1], [0.]))
+        # first day of the backtest per pair (first row after dropna)
+        start = np.maximum(np.maximum.outer(SMA1, SMA2) - 1, 1)
+        # sum of the returns following the days with a long position;
+        # blocks of SMA1 values keep the 3-D arrays at about 2m elements
+        long_rets = np.empty((len(SMA1), len(SMA2)))
+        block = max(1, int(2e6 // (len(SMA2) * n)))
+        with np.errstate(invalid='ignore'):
+            for i in range(0, len(SMA1), block):
+                # False as long as one of the SMAs is still NaN
+                long = sma1[i:i + block, np.newaxis] > sma2[np.newaxis]
+                long[:, :, 0] = False
+                long_rets[i:i + block] = np.dot(long[:, :, :-1], rets[1:])
+        # positions are +1 (long) or -1 (short), returns follow positions
+        aperf = np.exp(2 * long_rets - rsum[start + 1])
+        operf = aperf - np.exp(rsum[start])
+        index = pd.MultiIndex.from_product([SMA1, SMA2],
+                                           names=['SMA1', 'SMA2'])
+        return pd.DataFrame({'aperf': aperf.ravel(),
+                             'operf': operf.ravel()}, index=index)
+
     def optimize_parameters(self, SMA1_range, SMA2_range):
         ''' Finds global maximum given the SMA parameter ranges.
 
@@ -124,7 +177,10 @@ class SMAVectorBacktester(object):
         SMA1_range, SMA2_range: tuple
             tuples of the form (start, end, step size)
         '''
-        opt = brute(self.update_and_run, (SMA1_range, SMA2_range), finish=None)
+        results = self.grid_performance(SMA1_range, SMA2_range)
+        # first maximum of the rounded performance, as with scipy's brute
+        best = results['aperf'].round(2).values.argmax()
+        opt = np.array(results.index[best], dtype=float)
         return opt, -self.update_and_run(opt)
 
 
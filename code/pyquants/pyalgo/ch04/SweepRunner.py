@@ -0,0 +1,160 @@
+#
+# Python Module with Class
+# for Parallel Parameter Sweeps
+# of the Vectorized Backtesters
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import itertools
+import multiprocessing as mp
+import numpy as np
+import pandas as pd
+from wiki_mirror import get_prices
+
+# state of a worker process, set once by _init_worker
+_worker = {}
+
+
+def _init_worker(raw, shape, index, backtester, attributes):
+    ''' Attaches the worker to the shared price array.
+    '''
+    _worker['prices'] = np.frombuffer(raw).reshape(shape)
+    _worker['index'] = pd.DatetimeIndex(index)
+    _worker['backtester'] = backtester
+    _worker['attributes'] = attributes
+
+
+def _run_task(task):
+    ''' Backtests one symbol for a list of parameter sets.
+    '''
+    column, symbol, param_sets = task
+    # view on the shared memory, no copy of the other symbols
+    price = pd.Series(_worker['prices'][:, column],
+                      index=_worker['index']).dropna()
+    data = pd.DataFrame({'price': price})
+    data['return'] = np.log(data['price'] / data['price'].shift(1))
+    # the instance gets its data from the shared array instead of get_data
+    bt = _worker['backtester'].__new__(_worker['backtester'])
+    bt.__dict__.update(_worker['attributes'], symbol=symbol, results=None)
+    rows = []
+    for params in param_sets:
+        bt.data = data.copy()
+        if hasattr(bt, 'set_parameters'):
+            bt.set_parameters(**params)
+            aperf, operf = bt.run_strategy()
+        else:
+            aperf, operf = bt.run_strategy(**params)
+        trades = (bt.results['position'].diff().fillna(0) != 0).sum()
+        rows.append(dict(params, symbol=symbol, aperf=aperf, operf=operf,
+                         trades=int(trades)))
+    return rows
+
+
+class SweepRunner(object):
+    ''' Class for parameter sweeps of the vectorized backtesters over
+    many symbols, distributed across a pool of processes.
+
+    Attributes
+    ==========
+    backtester: class
+        vectorized backtester, e.g. MomVectorBacktester
+    symbols: list
+        symbols to backtest
+    start: str
+        start date for data retrieval
+    end: str
+        end date for data retrieval
+    amount: int, float
+        amount to be invested at the beginning
+    tc: float
+        proportional transaction costs (e.g. 0.5% = 0.005) per trade
+    prices: pd.DataFrame
+        prices with one column per symbol, retrieved if not given
+    processes: int
+        number of worker processes, defaults to the number of cores
+
+    Methods
+    =======
+    get_data:
+        retrieves the prices of all symbols
+    run:
+        backtests all symbols for all combinations of the parameter grids
+    '''
+
+    def __init__(self, backtester, symbols, start, end, amount=10000,
+                 tc=0.0, prices=None, processes=None):
+        self.backtester = backtester
+        self.symbols = list(symbols)
+        self.start = start
+        self.end = end
+        self.amount = amount
+        self.tc = tc
+        self.processes = processes or mp.cpu_count()
+        self.quandl_api_key = 'tazR87u-Jc7PsHZ2XV1-'
+        if prices is None:
+            self.get_data()
+        else:
+            self.prices = prices[self.symbols]
+
+    def get_data(self):
+        ''' Retrieves the prices of all symbols.
+        '''
+        self.prices = pd.DataFrame(
+            dict((symbol, get_prices(symbol, self.start, self.end,
+                                     self.quandl_api_key))
+                 for symbol in self.symbols))[self.symbols]
+
+    def run(self, **grids):
+        ''' Backtests all symbols for all combinations of the parameter
+        grids.
+
+        Parameters
+        ==========
+        grids: iterables
+            values per parameter of the backtester's run_strategy
+            (or set_parameters), e.g. momentum=range(1, 10)
+
+        Returns
+        =======
+        results: pd.DataFrame
+            one row per symbol and parameter set with the parameters,
+            aperf, operf and the number of trades
+        '''
+        names = sorted(grids)
+        param_sets = [dict(zip(names, values)) for values in
+                      itertools.product(*[grids[name] for name in names])]
+        # prices are copied once into shared memory instead of being
+        # pickled with every task
+        shape = self.prices.shape
+        raw = mp.RawArray('d', shape[0] * shape[1])
+        np.frombuffer(raw).reshape(shape)[:] = self.prices.values
+        attributes = {'start': self.start, 'end': self.end,
+                      'amount': self.amount, 'tc': self.tc}
+        # about four tasks per process and symbol to balance the load
+        size = max(1, len(param_sets) * len(self.symbols) //
+                   (4 * self.processes))
+        tasks = [(column, symbol, param_sets[i:i + size])
+                 for column, symbol in enumerate(self.symbols)
+                 for i in range(0, len(param_sets), size)]
+        pool = mp.Pool(self.processes, initializer=_init_worker,
+                       initargs=(raw, shape, self.prices.index.values,
+                                 self.backtester, attributes))
+        try:
+            rows = [row for rows in pool.imap_unordered(_run_task, tasks)
+                    for row in rows]
+        finally:
+            pool.close()
+            pool.join()
+        results = pd.DataFrame(rows, columns=['symbol'] + names +
+                               ['aperf', 'operf', 'trades'])
+        return results.sort_values(['symbol'] + names).reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    from MomVectorBacktester import MomVectorBacktester
+    sweep = SweepRunner(MomVectorBacktester, ['AAPL', 'MSFT', 'GLD'],
+                        '2010-1-1', '2016-10-31', 10000, 0.001)
+    results = sweep.run(momentum=range(1, 21))
+    print(results.sort_values('aperf', ascending=False).head(10))
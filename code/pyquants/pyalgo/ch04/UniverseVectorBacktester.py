@@ -0,0 +1,169 @@
+#
+# Python Module with Class
+# for Vectorized Backtesting
+# of Strategies on a Universe of Symbols
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import numpy as np
+import pandas as pd
+from wiki_mirror import get_prices
+
+
+class UniverseVectorBacktester(object):
+    ''' Class for the vectorized backtesting of SMA-, momentum- and
+    mean reversion-based trading strategies on many symbols at once.
+
+    Prices are held as one (dates x symbols) DataFrame, so that every
+    step of a backtest is a single operation on all symbols.
+
+    Attributes
+    ==========
+    symbols: list
+        symbols with which to work with
+    start: str
+        start date for data retrieval
+    end: str
+        end date for data retrieval
+    amount: int, float
+        amount to be invested at the beginning, split equally
+        across the symbols
+    tc: float
+        proportional transaction costs (e.g. 0.5% = 0.005) per trade
+    prices: pd.DataFrame
+        prices with one column per symbol, retrieved if not given
+
+    Methods
+    =======
+    get_data:
+        retrieves and prepares the base data set
+    run_sma_strategy:
+        runs the backtest for the SMA-based strategy
+    run_momentum_strategy:
+        runs the backtest for the momentum-based strategy
+    run_mean_reversion_strategy:
+        runs the backtest for the mean reversion-based strategy
+    symbol_performance:
+        returns the performance of the last backtest per symbol
+    plot_results:
+        plots the performance of the strategy compared to the universe
+    '''
+
+    def __init__(self, symbols, start, end, amount, tc, prices=None):
+        self.symbols = list(symbols)
+        self.start = start
+        self.end = end
+        self.amount = amount
+        self.tc = tc
+        self.results = None
+        self.quandl_api_key = 'tazR87u-Jc7PsHZ2XV1-'
+        if prices is None:
+            self.get_data()
+        else:
+            self.set_data(prices[self.symbols])
+
+    def get_data(self):
+        ''' Retrieves and prepares the data.
+        '''
+        raw = pd.DataFrame(
+            dict((symbol, get_prices(symbol, self.start, self.end,
+                                     self.quandl_api_key))
+                 for symbol in self.symbols))[self.symbols]
+        self.set_data(raw)
+
+    def set_data(self, prices):
+        ''' Sets the prices and log returns of the universe.
+        '''
+        self.price = prices.astype(float)
+        self.ret = np.log(self.price / self.price.shift(1))
+
+    def run_sma_strategy(self, SMA1, SMA2):
+        ''' Backtests the SMA-based strategy: long if the shorter SMA is
+        above the longer one, short otherwise.
+        '''
+        sma1 = self.price.rolling(SMA1).mean()
+        sma2 = self.price.rolling(SMA2).mean()
+        position = pd.DataFrame(np.where(sma1 > sma2, 1., -1.),
+                                index=self.price.index,
+                                columns=self.symbols)
+        # the backtest of a symbol starts once both SMAs are available
+        valid = sma1.notnull() & sma2.notnull()
+        return self._run(position.where(valid), start=valid)
+
+    def run_momentum_strategy(self, momentum=1):
+        ''' Backtests the momentum-based strategy: long (short) if the
+        mean return of the last momentum days is positive (negative).
+        '''
+        position = np.sign(self.ret.rolling(momentum).mean())
+        return self._run(position)
+
+    def run_mean_reversion_strategy(self, SMA, threshold):
+        ''' Backtests the mean reversion-based strategy: short (long) if
+        the price is threshold above (below) its SMA, neutral once the
+        price crosses the SMA.
+        '''
+        distance = self.price - self.price.rolling(SMA).mean()
+        position = pd.DataFrame(np.nan, index=self.price.index,
+                                columns=self.symbols)
+        position = position.mask(distance > threshold, -1.)
+        position = position.mask(distance < -threshold, 1.)
+        position = position.mask(distance * distance.shift(1) < 0, 0.)
+        return self._run(position.ffill().fillna(0))
+
+    def _run(self, position, start=None):
+        ''' Backtests the positions on all symbols and aggregates the
+        results to an equally weighted portfolio.
+        '''
+        ret = self.ret if start is None else self.ret.where(start)
+        strategy = position.shift(1) * ret
+        # determine when a trade takes place
+        trades = position.diff().fillna(0) != 0
+        # subtract transaction costs from return when trade takes place
+        strategy = strategy - trades * self.tc
+        self.position = position
+        self.trades = trades
+        self.creturns = self.amount * np.exp(ret.fillna(0).cumsum())
+        self.cstrategy = self.amount * np.exp(strategy.fillna(0).cumsum())
+        # symbols start with amount / n each; cash until their first price
+        self.results = pd.DataFrame({'creturns': self.creturns.mean(axis=1),
+                                     'cstrategy': self.cstrategy.mean(axis=1)})
+        # absolute performance of the strategy
+        aperf = self.results['cstrategy'].iloc[-1]
+        # out-/underperformance of strategy
+        operf = aperf - self.results['creturns'].iloc[-1]
+        return round(aperf, 2), round(operf, 2)
+
+    def symbol_performance(self):
+        ''' Returns the absolute performance, out-/underperformance and
+        number of trades per symbol of the last backtest.
+        '''
+        if self.results is None:
+            print('No results yet. Run a strategy.')
+            return
+        aperf = self.cstrategy.iloc[-1]
+        operf = aperf - self.creturns.iloc[-1]
+        return pd.DataFrame({'aperf': aperf.round(2),
+                             'operf': operf.round(2),
+                             'trades': self.trades.sum()})
+
+    def plot_results(self):
+        ''' Plots the cumulative performance of the trading strategy
+        compared to the equally weighted universe.
+        '''
+        if self.results is None:
+            print('No results to plot yet. Run a strategy.')
+        title = '%d symbols | TC = %.4f' % (len(self.symbols), self.tc)
+        self.results[['creturns', 'cstrategy']].plot(title=title,
+                                                     figsize=(10, 6))
+
+
+if __name__ == '__main__':
+    symbols = ['AAPL', 'MSFT', 'AMZN', 'GOOGL', 'GLD', 'GDX']
+    unibt = UniverseVectorBacktester(symbols, '2010-1-1', '2016-10-31',
+                                     10000, 0.001)
+    print(unibt.run_sma_strategy(42, 252))
+    print(unibt.run_momentum_strategy(momentum=2))
+    print(unibt.run_mean_reversion_strategy(SMA=50, threshold=5))
+    print(unibt.symbol_performance())
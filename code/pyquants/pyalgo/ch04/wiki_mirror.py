@@ -0,0 +1,160 @@
+#
+# Python Module to Mirror
+# the Quandl WIKI Database Locally
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import time
+import threading
+import configparser
+import pandas as pd
+import quandl as q
+from concurrent.futures import ThreadPoolExecutor
+
+codes_file = '../../../quandl/WIKI-datasets-codes.csv'
+mirror_file = '../data/wiki.parquet'
+
+
+class RateLimiter(object):
+    ''' Spaces out calls, across threads, to at most rate calls per second.
+    '''
+
+    def __init__(self, rate):
+        self.interval = 1. / rate
+        self.lock = threading.Lock()
+        self.next_call = time.time()
+
+    def wait(self):
+        ''' Blocks until the next call is allowed.
+        '''
+        with self.lock:
+            now = time.time()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def read_codes(codes_file=codes_file):
+    ''' Returns the list of Quandl codes (e.g. 'WIKI/AAPL') of the database.
+    '''
+    codes = pd.read_csv(codes_file, header=None, names=['code', 'name'])
+    return codes['code'].tolist()
+
+
+def build_mirror(api_key, codes=None, mirror_file=mirror_file,
+                 max_workers=8, rate=5., start_date=None, end_date=None):
+    ''' Downloads the datasets concurrently and stores them in one
+    compressed, columnar Parquet file with symbol and date columns.
+
+    Parameters
+    ==========
+    api_key: str
+        Quandl API key
+    codes: list
+        Quandl codes to mirror, defaults to all codes in codes_file
+    mirror_file: str
+        path of the Parquet file to (re)write
+    max_workers: int
+        number of downloads in flight at once
+    rate: float
+        maximum number of API calls per second
+    start_date, end_date: str
+        optional date range to mirror
+
+    Returns
+    =======
+    failed: list
+        codes that could not be downloaded
+    '''
+    # pyarrow is only needed for the mirror, not for get_prices' fallback
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    if codes is None:
+        codes = read_codes()
+    limiter = RateLimiter(rate)
+
+    def fetch(code):
+        limiter.wait()
+        try:
+            raw = q.get(code, start_date=start_date, end_date=end_date,
+                        api_key=api_key)
+        except Exception:
+            return code, None
+        raw.index.name = 'date'
+        raw = raw.reset_index()
+        raw.insert(0, 'symbol', code.split('/')[-1])
+        return code, raw
+
+    failed = []
+    writer = None
+    try:
+        with ThreadPoolExecutor(max_workers) as pool:
+            # downloads overlap; the file is written by this thread only
+            for code, raw in pool.map(fetch, codes):
+                if raw is None or len(raw) == 0:
+                    failed.append(code)
+                    continue
+                schema = writer.schema if writer is not None else None
+                try:
+                    table = pa.Table.from_pandas(raw, schema=schema,
+                                                 preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    # columns that do not fit those of the first dataset
+                    failed.append(code)
+                    continue
+                if writer is None:
+                    writer = pq.ParquetWriter(mirror_file, table.schema,
+                                              compression='zstd')
+                # one row group per symbol: its statistics let readers
+                # skip the row groups of all other symbols
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return failed
+
+
+def load_prices(symbol, start=None, end=None, column='Adj. Close',
+                mirror_file=mirror_file):
+    ''' Returns the column for symbol from the local mirror, optionally
+    restricted to the dates from start to end (inclusive).
+    '''
+    filters = [('symbol', '==', symbol)]
+    if start is not None:
+        filters.append(('date', '>=', pd.Timestamp(start)))
+    if end is not None:
+        filters.append(('date', '<=', pd.Timestamp(end)))
+    # only the date and price columns are read from disk
+    data = pd.read_parquet(mirror_file, columns=['date', column],
+                           filters=filters)
+    return data.set_index('date')[column]
+
+
+def get_prices(symbol, start, end, api_key, column='Adj. Close',
+               mirror_file=mirror_file):
+    ''' Returns prices from the local mirror, falling back to the Quandl API
+    if there is no mirror, the symbol is not in it or pyarrow is missing.
+    '''
+    try:
+        raw = load_prices(symbol, start, end, column, mirror_file)
+        if len(raw) > 0:
+            return raw
+    except (IOError, KeyError, ImportError):
+        pass
+    return q.get('WIKI/' + symbol, start_date=start, end_date=end,
+                 api_key=api_key)[column]
+
+
+if __name__ == '__main__':
+    config = configparser.ConfigParser()
+    config.read('../pyalgobook.cfg')
+    t0 = time.time()
+    failed = build_mirror(config['quandl']['api_key'])
+    print('mirrored in %.1fs | %d codes failed' % (time.time() - t0,
+                                                   len(failed)))
+    t0 = time.time()
+    print(load_prices('AAPL', '2010-1-1', '2016-10-31').tail())
+    print('loaded in %.3fs' % (time.time() - t0))
@@ -10,6 +10,8 @@
 import numpy as np
 import pandas as pd
 from pandas_datareader import data as web
+from walk_forward import lag_matrix, run_walk_forward
+from RecursiveLeastSquares import RecursiveLeastSquares
 
 h5 = pd.HDFStore('../data/equities.h5', 'r')
 data = h5['data']
@@ -44,6 +46,10 @@ class LRVectorBacktester(object):
         implements the regression step
     run_strategy:
         runs the backtest for the regression-based strategy
+    run_walk_forward:
+        runs the backtest with a rolling refit of the model
+    run_recursive_strategy:
+        runs the backtest with the regression updated bar by bar
     plot_results:
         plots the performance of the strategy compared to the symbol
     '''
@@ -85,13 +91,7 @@ class LRVectorBacktester(object):
         ''' Prepares the matrix for the regression and prediction steps.
         '''
         data = self.select_data(start, end)
-        matrix = np.zeros((self.lags + 1, len(data) - self.lags))
-        for i in range(self.lags + 1):
-            if i == self.lags:
-                matrix[i] = data.returns.values[i:]
-            else:
-                matrix[i] = data.returns.values[i:i - self.lags]
-        self.matrix = matrix
+        self.matrix = lag_matrix(data['returns'].values, self.lags).T
 
     def fit_model(self, start, end):
         ''' Implements the regression step.
@@ -126,6 +126,68 @@ class LRVectorBacktester(object):
         operf = aperf - self.results['creturns'].ix[-1]
         return round(aperf, 2), round(operf, 2)
 
+    def run_walk_forward(self, train, test, step=None, lags=3):
+        ''' Backtests the trading strategy with a rolling refit of the
+        model on train bars, predicting the next test bars each time.
+        '''
+        return run_walk_forward(self, train, test, step=step, lags=lags)
+
+    def run_recursive_strategy(self, start, end, lags=3, window=None,
+                               forgetting=1.0, warmup=None):
+        ''' Backtests the trading strategy with the regression updated
+        bar by bar by recursive least squares: each bar is predicted with
+        the coefficients estimated from the bars before it.
+
+        Parameters
+        ==========
+        start, end: str
+            period of the backtest
+        lags: int
+            number of lagged returns used as features
+        window: int
+            number of bars of a rolling estimation, None for expanding
+        forgetting: float
+            forgetting factor for an exponentially weighted estimation
+        warmup: int
+            number of bars before the first prediction, defaults to
+            window (or 10 * lags); with a window, the initial fit uses
+            the last window bars of the warmup
+        '''
+        self.lags = lags
+        warmup = warmup or window or 10 * lags
+        if window is not None and warmup < window:
+            raise ValueError('The warmup (%d bars) must not be shorter '
+                             'than the window (%d bars).' % (warmup, window))
+        data = self.select_data(start, end)
+        matrix = lag_matrix(data['returns'].values, lags)
+        X, y = matrix[:, :lags], np.sign(matrix[:, lags])
+        rls = RecursiveLeastSquares(lags, forgetting)
+        first = 0 if window is None else warmup - window
+        rls.fit(X[first:warmup], y[first:warmup])
+        prediction = np.zeros(len(X))
+        for i in range(warmup, len(X)):
+            prediction[i] = np.sign(rls.predict(X[i]))
+            rls.update(X[i], y[i])
+            if window is not None:
+                rls.downdate(X[i - window], y[i - window])
+        self.reg = rls.beta
+        # row i of the matrix predicts the return at bar i + lags
+        data = data.iloc[lags + warmup:].copy()
+        data['prediction'] = prediction[warmup:]
+        data['strategy'] = data['prediction'] * data['returns']
+        # determine when a trade takes place
+        trades = data['prediction'].diff().fillna(0) != 0
+        # subtract transaction costs from return when trade takes place
+        data.loc[trades, 'strategy'] -= self.tc
+        data['creturns'] = self.amount * np.exp(data['returns'].cumsum())
+        data['cstrategy'] = self.amount * np.exp(data['strategy'].cumsum())
+        self.results = data
+        # absolute performance of the strategy
+        aperf = self.results['cstrategy'].iloc[-1]
+        # out-/underperformance of strategy
+        operf = aperf - self.results['creturns'].iloc[-1]
+        return round(aperf, 2), round(operf, 2)
+
     def plot_results(self):
         ''' Plots the cumulative performance of the trading strategy
         compared to the symbol.
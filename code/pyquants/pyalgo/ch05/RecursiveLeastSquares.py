@@ -0,0 +1,94 @@
+#
+# Python Module with Class
+# for Recursive Least Squares Estimation
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import numpy as np
+
+
+class RecursiveLeastSquares(object):
+    ''' Class for updating least squares regression coefficients
+    observation by observation in O(n^2) instead of refitting in O(n^3).
+
+    Attributes
+    ==========
+    n: int
+        number of features (e.g. lags)
+    forgetting: float
+        forgetting factor, 1.0 for an expanding window, below 1.0 to
+        discount old observations exponentially
+    delta: float
+        regularization of the initial estimate if not fitted on a batch
+
+    Methods
+    =======
+    fit:
+        estimates the coefficients from a batch of observations
+    update:
+        adds one observation
+    downdate:
+        removes one observation (for rolling windows)
+    predict:
+        returns the prediction for a feature vector
+    '''
+
+    def __init__(self, n, forgetting=1.0, delta=1e-4):
+        self.n = n
+        self.forgetting = forgetting
+        # P is the inverse of X'X (up to the forgetting)
+        self.P = np.eye(n) / delta
+        self.beta = np.zeros(n)
+
+    def fit(self, X, y):
+        ''' Estimates the coefficients from the observations (rows) in X
+        and y as the starting point for the updates.
+        '''
+        self.P = np.linalg.pinv(np.dot(X.T, X))
+        self.beta = np.dot(self.P, np.dot(X.T, y))
+
+    def update(self, x, y):
+        ''' Adds the observation of features x and target y.
+        '''
+        Px = np.dot(self.P, x)
+        gain = Px / (self.forgetting + np.dot(x, Px))
+        self.beta = self.beta + gain * (y - np.dot(x, self.beta))
+        P = (self.P - np.outer(gain, Px)) / self.forgetting
+        # keep P symmetric against rounding errors
+        self.P = (P + P.T) / 2
+
+    def downdate(self, x, y):
+        ''' Removes the (earlier added) observation of features x and
+        target y.
+        '''
+        if self.forgetting != 1.0:
+            raise ValueError('Downdates require a forgetting factor of 1.')
+        Px = np.dot(self.P, x)
+        gain = Px / (1 - np.dot(x, Px))
+        self.beta = self.beta - gain * (y - np.dot(x, self.beta))
+        P = self.P + np.outer(gain, Px)
+        self.P = (P + P.T) / 2
+
+    def predict(self, x):
+        ''' Returns the prediction for features x.
+        '''
+        return np.dot(x, self.beta)
+
+
+if __name__ == '__main__':
+    # rolling estimates have to equal refits on the last window rows
+    np.random.seed(100)
+    X = np.random.standard_normal((1000, 5))
+    y = np.sign(np.random.standard_normal(1000))
+    window = 250
+    rls = RecursiveLeastSquares(5)
+    rls.fit(X[:window], y[:window])
+    for i in range(window, len(X)):
+        rls.update(X[i], y[i])
+        rls.downdate(X[i - window], y[i - window])
+        reg = np.linalg.lstsq(X[i - window + 1:i + 1],
+                              y[i - window + 1:i + 1], rcond=None)[0]
+        assert np.allclose(rls.beta, reg), i
+    print('rolling estimates equal lstsq refits')
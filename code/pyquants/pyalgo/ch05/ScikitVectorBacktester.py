@@ -11,6 +11,9 @@ import numpy as np
 import pandas as pd
 from pandas_datareader import data as web
 from sklearn import linear_model
+from sklearn.base import clone
+from concurrent.futures import ThreadPoolExecutor
+from walk_forward import lag_matrix, run_walk_forward
 
 h5 = pd.HDFStore('../data/equities.h5', 'r')
 data = h5['data']
@@ -38,6 +41,8 @@ class ScikitVectorBacktester(object):
 
     Methods
     =======
+    create_model:
+        returns the estimator for a model name
     get_data:
         retrieves and prepares the base data set
     select_data:
@@ -48,6 +53,10 @@ class ScikitVectorBacktester(object):
         implements the fitting step
     run_strategy:
         runs the backtest for the regression-based strategy
+    run_walk_forward:
+        runs the backtest with a rolling refit of the model
+    compare_models:
+        backtests several models and lags on the same data
     plot_results:
         plots the performance of the strategy compared to the symbol
     '''
@@ -59,13 +68,20 @@ class ScikitVectorBacktester(object):
         self.amount = amount
         self.tc = tc
         self.results = None
+        self.model = self.create_model(model)
+        self.get_data()
+
+    def create_model(self, model):
+        ''' Returns a new estimator for model ('regression' or 'logistic');
+        scikit-learn estimators are returned as they are.
+        '''
         if model == 'regression':
-            self.model = linear_model.LinearRegression()
+            return linear_model.LinearRegression()
         elif model == 'logistic':
-            self.model = linear_model.LogisticRegression(C=1e6)
-        else:
-            raise ValueError('Model not known or not yet implemented.')
-        self.get_data()
+            return linear_model.LogisticRegression(C=1e6)
+        elif hasattr(model, 'fit'):
+            return model
+        raise ValueError('Model not known or not yet implemented.')
 
     def get_data(self):
         ''' Retrieves and prepares the data.
@@ -95,13 +111,7 @@ class ScikitVectorBacktester(object):
         ''' Prepares the matrix for the regression and prediction steps.
         '''
         data = self.select_data(start, end)
-        matrix = np.zeros((self.lags + 1, len(data) - self.lags))
-        for i in range(self.lags + 1):
-            if i == self.lags:
-                matrix[i] = data.returns.values[i:]
-            else:
-                matrix[i] = data.returns.values[i:i - self.lags]
-        self.matrix = matrix
+        self.matrix = lag_matrix(data['returns'].values, self.lags).T
 
     def fit_model(self, start, end):
         ''' Implements the fitting step.
@@ -135,6 +145,64 @@ class ScikitVectorBacktester(object):
         operf = aperf - self.results['creturns'].ix[-1]
         return round(aperf, 2), round(operf, 2)
 
+    def run_walk_forward(self, train, test, step=None, lags=3):
+        ''' Backtests the trading strategy with a rolling refit of the
+        model on train bars, predicting the next test bars each time.
+        '''
+        return run_walk_forward(self, train, test, step=step, lags=lags)
+
+    def compare_models(self, start_in, end_in, start_out, end_out, models,
+                       lags=(3,), max_workers=4):
+        ''' Backtests every combination of models and lags and returns
+        the performance per combination.
+
+        The data is selected once; the feature matrices per number of
+        lags are views on the same returns, and the models are fitted on
+        a thread pool.
+
+        Parameters
+        ==========
+        start_in, end_in, start_out, end_out: str
+            in-sample and out-of-sample periods
+        models: dict
+            names and models ('regression', 'logistic' or scikit-learn
+            estimators, which are cloned per fit)
+        lags: list
+            numbers of lags to use as features
+        max_workers: int
+            number of models fitted at once
+
+        Returns
+        =======
+        results: pd.DataFrame
+            aperf, operf and number of trades per model and lags
+        '''
+        returns_in = self.select_data(start_in, end_in)['returns'].values
+        returns_out = self.select_data(start_out, end_out)['returns'].values
+        configs = [(name, lag) for name in models for lag in lags]
+
+        def backtest(config):
+            name, lag = config
+            model = clone(self.create_model(models[name]))
+            matrix = lag_matrix(returns_in, lag)
+            model.fit(matrix[:, :lag], np.sign(matrix[:, lag]))
+            prediction = np.zeros(len(returns_out))
+            prediction[lag:] = model.predict(
+                lag_matrix(returns_out, lag)[:, :lag])
+            strategy = prediction * returns_out
+            # transaction costs when the prediction changes
+            trades = np.diff(prediction) != 0
+            strategy[1:][trades] -= self.tc
+            aperf = self.amount * np.exp(strategy.sum())
+            operf = aperf - self.amount * np.exp(returns_out.sum())
+            return round(aperf, 2), round(operf, 2), trades.sum()
+
+        with ThreadPoolExecutor(max_workers) as pool:
+            performance = list(pool.map(backtest, configs))
+        index = pd.MultiIndex.from_tuples(configs, names=['model', 'lags'])
+        return pd.DataFrame(performance, index=index,
+                            columns=['aperf', 'operf', 'trades'])
+
     def plot_results(self):
         ''' Plots the cumulative performance of the trading strategy
         compared to the symbol.
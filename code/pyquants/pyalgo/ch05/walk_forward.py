@@ -0,0 +1,102 @@
+#
+# Python Module for
+# Walk-Forward Backtesting
+# of Regression- and Machine Learning-based Strategies
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+
+def lag_matrix(returns, lags):
+    ''' Returns a read-only view of shape (len(returns) - lags, lags + 1)
+    on returns: row i holds returns[i:i + lags] as features and
+    returns[i + lags] as target, without copying.
+    '''
+    returns = np.ascontiguousarray(returns, dtype=float)
+    stride = returns.strides[0]
+    return np.lib.stride_tricks.as_strided(
+        returns, shape=(len(returns) - lags, lags + 1),
+        strides=(stride, stride), writeable=False)
+
+
+def _fit_predict(backtester, matrix, lags, train, test):
+    ''' Fits on the rows in train and predicts the rows in test.
+    '''
+    X, y = matrix[train, :lags], np.sign(matrix[train, lags])
+    if hasattr(backtester, 'model'):
+        from sklearn.base import clone
+        model = clone(backtester.model).fit(X, y)
+        return model.predict(matrix[test, :lags])
+    reg = np.linalg.lstsq(X, y, rcond=None)[0]
+    return np.sign(np.dot(matrix[test, :lags], reg))
+
+
+def run_walk_forward(backtester, train, test, step=None, lags=3,
+                     max_workers=4):
+    ''' Backtests the strategy of an LRVectorBacktester or
+    ScikitVectorBacktester with a rolling refit: the model is fitted on
+    train bars, predicts the next test bars, and the window moves on by
+    step bars. The out-of-sample predictions are stitched together.
+
+    Parameters
+    ==========
+    backtester: LRVectorBacktester or ScikitVectorBacktester
+        backtester with the data to use
+    train: int
+        number of bars (samples) per fit
+    test: int
+        number of bars predicted per fit
+    step: int
+        number of bars the window moves on, at most test (the default);
+        with a smaller step, a bar gets the prediction of the latest fit
+    lags: int
+        number of lagged returns used as features
+    max_workers: int
+        number of windows fitted at once
+
+    Returns
+    =======
+    aperf, operf: float
+        absolute performance and out-/underperformance of the strategy
+    '''
+    step = step or test
+    if step > test:
+        raise ValueError('The step (%d bars) must not be longer than the '
+                         'test window (%d bars).' % (step, test))
+    returns = backtester.data['returns'].values
+    matrix = lag_matrix(returns, lags)
+    starts = range(0, len(matrix) - train, step)
+    windows = [(slice(s, s + train), slice(s + train, s + train + test))
+               for s in starts]
+    if not windows:
+        raise ValueError('Not enough data for a train window of %d bars.'
+                         % train)
+    # the fits are independent; NumPy and scikit-learn release the GIL
+    with ThreadPoolExecutor(max_workers) as pool:
+        predictions = list(pool.map(
+            lambda w: _fit_predict(backtester, matrix, lags, *w), windows))
+    prediction = np.full(len(matrix), np.nan)
+    for (_, test_rows), pred in zip(windows, predictions):
+        prediction[test_rows] = pred
+    # row i of the matrix predicts the return at bar i + lags
+    data = backtester.data.iloc[lags:].copy()
+    data['prediction'] = prediction
+    data = data.iloc[train:]
+    data['strategy'] = data['prediction'] * data['returns']
+    # determine when a trade takes place
+    trades = data['prediction'].diff().fillna(0) != 0
+    # subtract transaction costs from return when trade takes place
+    data.loc[trades, 'strategy'] -= backtester.tc
+    data['creturns'] = backtester.amount * np.exp(data['returns'].cumsum())
+    data['cstrategy'] = backtester.amount * np.exp(data['strategy'].cumsum())
+    backtester.lags = lags
+    backtester.results = data
+    # absolute performance of the strategy
+    aperf = data['cstrategy'].iloc[-1]
+    # out-/underperformance of strategy
+    operf = aperf - data['creturns'].iloc[-1]
+    return round(aperf, 2), round(operf, 2)
@@ -27,11 +27,15 @@ class BacktestBase(object):
         fixed transaction costs per trade (buy or sell)
     ptc: float
         proportional transaction costs per trade (buy or sell)
+    data: pd.DataFrame
+        price and return data to use instead of retrieving it
 
     Methods
     =======
     get_data:
         retrieves and prepares the base data set
+    set_data:
+        sets the base data set
     plot_data:
         plots the closing price for the symbol
     print_balance:
@@ -42,11 +46,18 @@ class BacktestBase(object):
         places a buy order
     place_sell_order:
         places a sell order
+    record_order:
+        adds an order to the trade ledger
     close_out:
-        closes out a long or short position
+        closes out a long or short position, returns ledger and equity
     '''
+    # record of one order in the trade ledger (side: 1 buy, -1 sell)
+    ledger_dtype = np.dtype([('bar', 'i8'), ('side', 'i1'), ('units', 'f8'),
+                             ('price', 'f8'), ('costs', 'f8'),
+                             ('balance', 'f8'), ('inventory', 'f8')])
 
-    def __init__(self, symbol, start, end, amount, ftc=0.0, ptc=0.0):
+    def __init__(self, symbol, start, end, amount, ftc=0.0, ptc=0.0,
+                 data=None):
         self.symbol = symbol
         self.start = start
         self.end = end
@@ -58,7 +69,14 @@ class BacktestBase(object):
         self.position = 0
         self.trades = 0
         self.verbose = True
-        self.get_data()
+        self._ledger = np.zeros(64, dtype=self.ledger_dtype)
+        self._orders = 0
+        self.ledger = None
+        self.equity = None
+        if data is None:
+            self.get_data()
+        else:
+            self.set_data(data)
 
     def get_data(self):
         ''' Retrieves and prepares the data.
@@ -68,7 +86,14 @@ class BacktestBase(object):
         raw = pd.DataFrame(raw)
         raw.rename(columns={'Close': 'price'}, inplace=True)
         raw['return'] = np.log(raw / raw.shift(1))
-        self.data = raw.dropna()
+        self.set_data(raw.dropna())
+
+    def set_data(self, data):
+        ''' Sets the data (with price and return columns).
+        '''
+        self.data = data
+        # plain array of prices for the event loop
+        self.prices = self.data['price'].values
 
     def plot_data(self):
         ''' Plots the (adjusted) closing prices for symbol.
@@ -84,19 +109,21 @@ class BacktestBase(object):
         ''' Return date and price for bar.
         '''
         date = str(self.data.index[bar])
-        price = self.data.price.ix[bar]
+        price = self.prices[bar]
         return date, price
 
     def place_buy_order(self, bar, units=None, amount=None):
         ''' Place a buy order.
         '''
-        date, price = self.get_date_price(bar)
+        price = self.prices[bar]
         if units is None:
             units = math.floor(amount / price)
         self.amount -= (units * price) * (1 + self.ptc) + self.ftc
         self.units += units
         self.trades += 1
+        self.record_order(bar, 1, units, price)
         if self.verbose:
+            date = str(self.data.index[bar])
             print('%s | buying  %4d units at %7.2f' %
                   (date[:10], units, price))
             self.print_balance(date)
@@ -104,31 +131,73 @@ class BacktestBase(object):
     def place_sell_order(self, bar, units=None, amount=None):
         ''' Place a sell order.
         '''
-        date, price = self.get_date_price(bar)
+        price = self.prices[bar]
         if units is None:
             units = math.floor(amount / price)
         self.amount += (units * price) * (1 - self.ptc) - self.ftc
         self.units -= units
         self.trades += 1
+        self.record_order(bar, -1, units, price)
         if self.verbose:
+            date = str(self.data.index[bar])
             print('%s | selling %4d units at %7.2f' %
                   (date[:10], units, price))
             self.print_balance(date)
 
+    def record_order(self, bar, side, units, price):
+        ''' Add an order (after its execution) to the trade ledger.
+        '''
+        if self._orders == len(self._ledger):
+            # double the capacity, amortized O(1) per order
+            self._ledger = np.concatenate((self._ledger,
+                                           np.zeros_like(self._ledger)))
+        costs = units * price * self.ptc + self.ftc
+        self._ledger[self._orders] = (bar, side, units, price, costs,
+                                      self.amount, self.units)
+        self._orders += 1
+
     def close_out(self, bar):
         ''' Closing out a long or short position.
+
+        Returns
+        =======
+        ledger: pd.DataFrame
+            orders of the backtest (bar, side, units, price, costs and
+            cash balance and units held after the order) by date
+        equity: pd.DataFrame
+            cash balance, units held and equity per bar
         '''
         date, price = self.get_date_price(bar)
         self.amount += self.units * price
         if self.verbose:
             print('%s | inventory %d units at %.2f' % (date[:10],
                                                        self.units, price))
+        self.units = 0
         if self.verbose:
             print('=' * 55)
         print('Final balance   [$] %13.2f' % self.amount)
         print('Net Performance [%%] %13.2f' % ((self.amount - self._amount) /
                                                self._amount * 100))
         print('=' * 55)
+        orders = self._ledger[:self._orders]
+        self.ledger = pd.DataFrame(orders,
+                                   index=self.data.index[orders['bar']])
+        # balance and units change with orders only; every bar takes the
+        # state after the last order up to it
+        last = np.searchsorted(orders['bar'], np.arange(bar + 1),
+                               side='right') - 1
+        balance = np.where(last >= 0, orders['balance'][last], self._amount)
+        inventory = np.where(last >= 0, orders['inventory'][last], 0)
+        balance[-1] = self.amount
+        inventory[-1] = 0
+        self.equity = pd.DataFrame({'balance': balance,
+                                    'inventory': inventory},
+                                   index=self.data.index[:bar + 1])
+        self.equity['equity'] = (self.equity['balance'] +
+                                 self.equity['inventory'] *
+                                 self.prices[:bar + 1])
+        self._orders = 0
+        return self.ledger, self.equity
 
 if __name__ == '__main__':
     bb = BacktestBase('AAPL', '2010-1-1', '2016-10-31', 10000)
@@ -6,8 +6,19 @@
 # (c) Dr. Yves J. Hilpisch
 # The Python Quants GmbH
 #
+import os
+import sys
 from BacktestBase import *
 
+# the indicator cache of chapter 4; ch04 is taken off the module path
+# again so that its modules do not shadow those of this chapter
+ch04 = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ch04')
+sys.path.insert(0, ch04)
+try:
+    from IndicatorCache import cache
+finally:
+    sys.path.remove(ch04)
+
 
 class BacktestLongOnly(BacktestBase):
 
@@ -26,20 +37,23 @@ class BacktestLongOnly(BacktestBase):
         print('=' * 55)
         self.position = 0  # initial neutral position
         self.amount = self._amount  # reset initial capital
-        self.data['SMA1'] = self.data['price'].rolling(SMA1).mean()
-        self.data['SMA2'] = self.data['price'].rolling(SMA2).mean()
+        self.data['SMA1'] = cache.sma(self.data['price'], SMA1)
+        self.data['SMA2'] = cache.sma(self.data['price'], SMA2)
+        # plain arrays for the event loop
+        sma1 = self.data['SMA1'].values
+        sma2 = self.data['SMA2'].values
 
         for bar in range(len(self.data)):
             if bar >= SMA2:
                 if self.position == 0:
-                    if self.data['SMA1'].ix[bar] > self.data['SMA2'].ix[bar]:
+                    if sma1[bar] > sma2[bar]:
                         self.place_buy_order(bar, amount=self.amount)
                         self.position = 1  # long position
                 elif self.position == 1:
-                    if self.data['SMA1'].ix[bar] < self.data['SMA2'].ix[bar]:
+                    if sma1[bar] < sma2[bar]:
                         self.place_sell_order(bar, units=self.units)
                         self.position = 0  # market neutral
-        self.close_out(bar)
+        return self.close_out(bar)
 
     def run_momentum_strategy(self, momentum):
         ''' Backtesting a momentum-based strategy.
@@ -57,19 +71,20 @@ class BacktestLongOnly(BacktestBase):
         self.position = 0  # initial neutral position
         self.amount = self._amount  # reset initial capital
 
-        self.data['momentum'] = self.data['return'].rolling(momentum).mean()
+        self.data['momentum'] = cache.sma(self.data['return'], momentum)
+        mom = self.data['momentum'].values
 
         for bar in range(len(self.data)):
             if bar >= momentum:
                 if self.position == 0:
-                    if self.data['momentum'].ix[bar] > 0:
+                    if mom[bar] > 0:
                         self.place_buy_order(bar, amount=self.amount)
                         self.position = 1  # long position
                 elif self.position == 1:
-                    if self.data['momentum'].ix[bar] <= 0:
+                    if mom[bar] <= 0:
                         self.place_sell_order(bar, units=self.units)
                         self.position = 0  # market neutral
-        self.close_out(bar)
+        return self.close_out(bar)
 
     def run_mean_reversion_strategy(self, SMA, threshold):
         ''' Backtesting a mean reversion-based strategy.
@@ -90,20 +105,21 @@ class BacktestLongOnly(BacktestBase):
         self.position = 0
         self.amount = self._amount
 
-        self.data['SMA'] = self.data['price'].rolling(SMA).mean()
+        self.data['SMA'] = cache.sma(self.data['price'], SMA)
+        price = self.prices
+        sma = self.data['SMA'].values
 
         for bar in range(len(self.data)):
             if bar >= SMA:
                 if self.position == 0:
-                    if (self.data['price'].ix[bar] <
-                            self.data['SMA'].ix[bar] - threshold):
+                    if price[bar] < sma[bar] - threshold:
                         self.place_buy_order(bar, amount=self.amount)
                         self.position = 1
                 elif self.position == 1:
-                    if self.data['price'].ix[bar] >= self.data['SMA'].ix[bar]:
+                    if price[bar] >= sma[bar]:
                         self.place_sell_order(bar, units=self.units)
                         self.position = 0
-        self.close_out(bar)
+        return self.close_out(bar)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,127 @@
+#
+# Python Script with Class
+# for Running Grids of Event-based Backtests
+# in Parallel
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import contextlib
+import itertools
+import os
+import multiprocessing as mp
+import numpy as np
+import pandas as pd
+
+# state of a worker process, set once by _init_worker
+_worker = {}
+
+
+def _init_worker(raw, shape, index, backtester, symbol, amount):
+    ''' Attaches the worker to the shared data array.
+    '''
+    values = np.frombuffer(raw).reshape(shape)
+    _worker['data'] = pd.DataFrame(values, index=pd.DatetimeIndex(index),
+                                   columns=['price', 'return'])
+    _worker['backtester'] = backtester
+    _worker['symbol'] = symbol
+    _worker['amount'] = amount
+
+
+def _run_task(task):
+    ''' Runs one strategy with one set of parameters and costs.
+    '''
+    strategy, params, ftc, ptc = task
+    # a new instance per task; strategies add columns to their own copy
+    bt = _worker['backtester'](_worker['symbol'], None, None,
+                               _worker['amount'], ftc, ptc,
+                               data=_worker['data'].copy())
+    bt.verbose = False
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            ledger, equity = getattr(bt, 'run_%s_strategy' % strategy)(
+                *params)
+    peak = np.maximum.accumulate(equity['equity'].values)
+    drawdown = ((peak - equity['equity'].values) / peak).max()
+    return {'strategy': strategy, 'params': params, 'ftc': ftc, 'ptc': ptc,
+            'balance': bt.amount,
+            'performance': (bt.amount - bt._amount) / bt._amount * 100,
+            'trades': len(ledger), 'costs': ledger['costs'].sum(),
+            'max_drawdown': drawdown * 100}
+
+
+class BacktestRunner(object):
+    ''' Class for running many strategies, parameters and transaction
+    costs of an event-based backtester in a pool of processes.
+
+    Attributes
+    ==========
+    backtester: BacktestLongOnly, BacktestLongShort
+        backtester (instance) with the data to use
+    processes: int
+        number of worker processes, defaults to the number of cores
+
+    Methods
+    =======
+    run:
+        runs all combinations and returns the summary
+    '''
+
+    def __init__(self, backtester, processes=None):
+        self.backtester = backtester
+        self.processes = processes or mp.cpu_count()
+
+    def run(self, strategies, ftc=(0.0,), ptc=(0.0,)):
+        ''' Runs every strategy with every combination of transaction
+        costs.
+
+        Parameters
+        ==========
+        strategies: list
+            tuples of strategy name and parameters, e.g.
+            ('sma', (42, 252)), ('momentum', (60,)) or
+            ('mean_reversion', (50, 5))
+        ftc, ptc: list
+            fixed and proportional transaction costs to use
+
+        Returns
+        =======
+        results: pd.DataFrame
+            final balance, net performance [%], trades, costs and maximum
+            drawdown [%] per combination
+        '''
+        tasks = [(strategy, tuple(params), f, p) for (strategy, params), f, p
+                 in itertools.product(strategies, ftc, ptc)]
+        data = self.backtester.data[['price', 'return']]
+        # the data is copied once into shared memory instead of being
+        # pickled with every task
+        raw = mp.RawArray('d', data.size)
+        np.frombuffer(raw).reshape(data.shape)[:] = data.values
+        pool = mp.Pool(self.processes, initializer=_init_worker,
+                       initargs=(raw, data.shape, data.index.values,
+                                 type(self.backtester),
+                                 self.backtester.symbol,
+                                 self.backtester._amount))
+        try:
+            results = pool.map(_run_task, tasks)
+        finally:
+            pool.close()
+            pool.join()
+        return pd.DataFrame(results, columns=[
+            'strategy', 'params', 'ftc', 'ptc', 'balance', 'performance',
+            'trades', 'costs', 'max_drawdown'])
+
+
+if __name__ == '__main__':
+    from BacktestLongShort import BacktestLongShort
+    lsbt = BacktestLongShort('AAPL', '2010-1-1', '2016-10-31', 10000)
+    runner = BacktestRunner(lsbt)
+    strategies = ([('sma', (SMA1, SMA2)) for SMA1 in range(20, 61, 10)
+                   for SMA2 in range(180, 281, 50)] +
+                  [('momentum', (momentum,))
+                   for momentum in range(10, 91, 20)] +
+                  [('mean_reversion', (50, threshold))
+                   for threshold in range(1, 11, 3)])
+    results = runner.run(strategies, ftc=[0.0, 10.0], ptc=[0.0, 0.005])
+    print(results.sort_values('performance', ascending=False).head(10))
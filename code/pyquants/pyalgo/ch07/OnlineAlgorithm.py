@@ -7,30 +7,27 @@
 # The Python Quants GmbH
 #
 import zmq
-import datetime
-import numpy as np
-import pandas as pd
+import time
+from TickStore import TickStore
 
 context = zmq.Context()
 socket = context.socket(zmq.SUB)
 socket.connect('tcp://0.0.0.0:5555')
 socket.setsockopt_string(zmq.SUBSCRIBE, 'AAPL')
 
-df = pd.DataFrame()
+# 5 second bars, momentum of the last 3 bar returns
+store = TickStore(freq=5, momentum=3)
 
 while True:
     data = socket.recv_string()
-    t = datetime.datetime.now()
+    t = time.time()
     sym, value = data.split()
-    df = df.append(pd.DataFrame({sym: float(value)}, index=[t]))
-    dr = df.resample('5s').last()
-    dr['returns'] = np.log(dr / dr.shift(1))
-    dr['momentum'] = np.sign(dr['returns'].rolling(3).mean())
+    store.add(t, float(value))
     print('\n' + '=' * 51)
-    print(dr.tail())
-    if dr['momentum'].ix[-1] == 1.0:
+    print(store.tail())
+    if store.momentum == 1.0:
         print('\nLong market position.')
         # take some action (e.g. place buy order)
-    elif dr['momentum'].ix[-1] == -1.0:
+    elif store.momentum == -1.0:
         print('\nShort market position.')
         # take some action (e.g. place sell order)
@@ -0,0 +1,165 @@
+#
+# Python Module with Classes
+# for Storing Ticks and Aggregating
+# them to Bars Incrementally
+#
+# Python for Algorithmic Trading
+# (c) Dr. Yves J. Hilpisch
+# The Python Quants GmbH
+#
+import math
+import datetime
+from collections import deque
+import numpy as np
+import pandas as pd
+
+
+class RingBuffer(object):
+    ''' Class for a fixed-capacity buffer of rows of floats; once full,
+    every new row overwrites the oldest one.
+
+    Attributes
+    ==========
+    capacity: int
+        maximum number of rows held
+    width: int
+        number of values per row
+
+    Methods
+    =======
+    append:
+        adds a row in O(1)
+    last:
+        returns the last rows, oldest first
+    '''
+
+    def __init__(self, capacity, width=1):
+        self.capacity = capacity
+        self.rows = np.full((capacity, width), np.nan)
+        self.count = 0  # rows appended so far
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, row):
+        ''' Adds a row, overwriting the oldest one if full.
+        '''
+        self.rows[self.count % self.capacity] = row
+        self.count += 1
+
+    def last(self, n=None):
+        ''' Returns (a copy of) the last n rows, oldest first.
+        '''
+        n = len(self) if n is None else min(n, len(self))
+        pos = np.arange(self.count - n, self.count) % self.capacity
+        return self.rows[pos]
+
+
+class RollingSum(object):
+    ''' Class for the sum of the last window values, updated in O(1);
+    the sum is NaN while the window is not full or holds a NaN.
+
+    Methods
+    =======
+    append:
+        adds a value, dropping the oldest one
+    '''
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.total = 0.
+        self.nans = 0
+        self.sum = np.nan
+
+    def append(self, value):
+        ''' Adds value to the window.
+        '''
+        self.values.append(value)
+        if math.isnan(value):
+            self.nans += 1
+        else:
+            self.total += value
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nans -= 1
+            else:
+                self.total -= old
+        full = len(self.values) == self.window
+        self.sum = self.total if full and not self.nans else np.nan
+
+
+class TickStore(object):
+    ''' Class for storing ticks of a symbol and aggregating them
+    incrementally to bars with log returns and momentum; the cost per
+    tick does not depend on the number of ticks seen before.
+
+    The bars are those of df.resample(freq).last() on the ticks, the
+    momentum that of np.sign(returns.rolling(momentum).mean()) on the
+    bars, both including the current (not yet closed) bar.
+
+    Attributes
+    ==========
+    freq: int
+        bar length in seconds
+    momentum: int
+        number of bar returns for the momentum
+    capacity: int
+        number of ticks and of closed bars kept
+
+    Methods
+    =======
+    add:
+        adds a tick and returns the bars it closed
+    tail:
+        returns the last bars as a DataFrame
+    '''
+
+    def __init__(self, freq=5, momentum=3, capacity=100000):
+        self.freq = freq
+        self.window = momentum
+        self.ticks = RingBuffer(capacity, 2)  # time, price
+        self.bars = RingBuffer(capacity, 4)  # time, close, return, momentum
+        self.returns = RollingSum(momentum - 1)  # of the closed bars
+        self.bar_time = None  # start of the current bar
+        self.close = np.nan  # last price of the current bar
+        self.prev_close = np.nan  # close of the last closed bar
+        self.ret = np.nan
+        self.momentum = np.nan
+
+    def _close_bar(self, close):
+        self.bars.append((self.bar_time, close, self.ret, self.momentum))
+        self.returns.append(self.ret)
+        self.prev_close = close
+
+    def add(self, t, price):
+        ''' Adds a tick (t in seconds since the epoch) and returns the
+        number of bars it closed.
+        '''
+        self.ticks.append((t, price))
+        bar_time = t - t % self.freq
+        closed = 0
+        if self.bar_time is None:
+            self.bar_time = bar_time
+        while bar_time > self.bar_time:
+            # bars without ticks are closed with a NaN price
+            self._close_bar(self.close)
+            self.bar_time += self.freq
+            self.close = self.ret = self.momentum = np.nan
+            closed += 1
+        self.close = price
+        # O(1) updates of the return and momentum of the current bar
+        self.ret = math.log(price / self.prev_close)
+        self.momentum = np.sign((self.returns.sum + self.ret) / self.window)
+        return closed
+
+    def tail(self, n=5):
+        ''' Returns the last n bars (including the current one).
+        '''
+        rows = np.vstack((self.bars.last(n - 1),
+                          [(self.bar_time, self.close, self.ret,
+                            self.momentum)]))
+        index = [datetime.datetime.fromtimestamp(t) for t in rows[:, 0]]
+        return pd.DataFrame(rows[:, 1:], index=index,
+                            columns=['price', 'returns', 'momentum'])